@@ -1,7 +1,8 @@
 """Item management service."""
-from typing import Optional, List, TypeVar, cast, Dict
+from typing import Optional, List, TypeVar, cast, Dict, Tuple
 from datetime import datetime, UTC
 from dataclasses import dataclass
+from functools import lru_cache
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy import select
 
@@ -14,6 +15,36 @@ from .base_service import BaseService, Result
 T = TypeVar('T')
 
 
+@lru_cache(maxsize=512)
+def _check_item_name(name: str) -> Tuple[bool, str]:
+    """Validate an item name, cached per distinct string.
+    
+    Returns:
+        (True, normalized name) or (False, error message)
+    """
+    # Basic validation
+    if not name or not name.strip():
+        return False, "שם הפריט לא יכול להיות ריק"
+    
+    # Validate Hebrew text
+    try:
+        hebrew_name = HebrewText(name)
+    except (ValueError, TypeError) as e:
+        return False, str(e) if e.args else "שם לא תקין"
+    
+    # Create normalized version
+    normalized = hebrew_name.strip().lower()
+    
+    # Check length
+    if len(normalized) < 2:
+        return False, "שם הפריט חייב להכיל לפחות 2 תווים"
+    
+    if len(normalized) > 100:
+        return False, "שם הפריט לא יכול להכיל יותר מ-100 תווים"
+    
+    return True, normalized
+
+
 @dataclass
 class ItemLocation:
     """Represents an item's location in a list."""
@@ -422,7 +453,7 @@ class ItemService(BaseService):
             include_bought: Whether to include bought items (default: False)
             
         Returns:
-            Result containing list of item locations or error
+            Result containing item locations ordered by list, or error
         """
         try:
             # Validate and normalize name
@@ -447,6 +478,9 @@ class ItemService(BaseService):
                 if not include_bought:
                     query = query.where(GroceryItem.is_bought == False)
                 
+                # Deterministic order: by list, then by insertion within a list
+                query = query.order_by(GroceryItem.list_id, GroceryItem.id)
+                
                 results = session.execute(query).all()
                 
                 # Convert to ItemLocation objects
@@ -490,27 +524,9 @@ class ItemService(BaseService):
             Result containing normalized name or error
         """
         try:
-            # Basic validation
-            if not name or not name.strip():
-                return Result.fail("שם הפריט לא יכול להיות ריק")
-            
-            # Validate Hebrew text
-            try:
-                hebrew_name = HebrewText(name)
-            except (ValueError, TypeError) as e:
-                return Result.fail(str(e) if e.args else "שם לא תקין")
-            
-            # Create normalized version
-            normalized = hebrew_name.strip().lower()
-            
-            # Check length
-            if len(normalized) < 2:
-                return Result.fail("שם הפריט חייב להכיל לפחות 2 תווים")
-            
-            if len(normalized) > 100:
-                return Result.fail("שם הפריט לא יכול להכיל יותר מ-100 תווים")
-            
-            return Result.ok(normalized)
+            # Result is mutable, so cache the check and build a fresh one per call
+            ok, value = _check_item_name(name)
+            return Result.ok(value) if ok else Result.fail(value)
             
         except Exception as e:
             self.logger.exception("Failed to validate item name")
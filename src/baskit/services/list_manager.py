@@ -48,4 +48,9 @@ def get_list() -> List[Dict[str, Any]]:
         List of item dictionaries
     """
     logger.debug(f"Returning list with {len(_grocery_list)} items")
-    return _grocery_list.copy()  # Return copy to prevent external modifications 
\ No newline at end of file
+    return _grocery_list.copy()  # Return copy to prevent external modifications
+
+def reset_list() -> None:
+    """Remove all items from the grocery list."""
+    logger.info("Clearing list")
+    _grocery_list.clear()
@@ -1,5 +1,6 @@
 """List management service."""
-from typing import Optional, List, TypeVar, cast, Dict, Sequence
+from typing import Optional, List, TypeVar, cast, Dict, Sequence, Tuple
+from datetime import datetime
 from dataclasses import dataclass
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy import select, update, func
@@ -32,6 +33,10 @@ class ListContents:
     is_default: bool
 
 
+# Cheap change marker for a list: (item count, latest item update, list update)
+ListFingerprint = Tuple[int, Optional[datetime], Optional[datetime]]
+
+
 class ListService(BaseService):
     """Service for managing grocery lists."""
 
@@ -492,6 +497,47 @@ class ListService(BaseService):
             self.logger.exception("Failed to show list")
             return Result.fail("שגיאה בהצגת הרשימה")
 
+    def get_fingerprint(self, list_id: int) -> Result[ListFingerprint]:
+        """
+        Get a cheap fingerprint of a list's contents.
+        
+        The fingerprint changes whenever an item is added, removed or
+        updated, or when the list itself is updated (renamed, deleted),
+        so it can be used as a cache key for the list contents.
+        
+        Args:
+            list_id: ID of list to fingerprint
+            
+        Returns:
+            Result containing (item count, max item updated_at, list updated_at)
+        """
+        try:
+            with self.transaction.transaction() as session:
+                row = session.execute(
+                    select(
+                        func.count(GroceryItem.id),
+                        func.max(GroceryItem.updated_at),
+                        GroceryList.updated_at
+                    )
+                    .select_from(GroceryList)
+                    .outerjoin(GroceryItem)
+                    .where(
+                        GroceryList.id == list_id,
+                        GroceryList.owner_id == self.user_id
+                    )
+                    .group_by(GroceryList.id)
+                ).one_or_none()
+                
+                if row is None:
+                    return Result.fail("רשימה לא נמצאה")
+                
+                item_count, items_updated_at, list_updated_at = row
+                return Result.ok((item_count, items_updated_at, list_updated_at))
+                
+        except Exception as e:
+            self.logger.exception("Failed to get list fingerprint")
+            return Result.fail("שגיאה בבדיקת מצב הרשימה")
+
     def list_all_user_lists(
         self,
         include_deleted: bool = False
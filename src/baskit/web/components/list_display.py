@@ -1,13 +1,126 @@
 """List display component for showing items and their actions."""
+from dataclasses import dataclass
+from typing import Tuple, cast
+
 import streamlit as st
-from typing import cast
 
-from baskit.services.list_service import ListService, ListContents
+from baskit.services.list_service import ListService, ListContents, ListFingerprint
 from baskit.services.item_service import ItemService
 from baskit.services.base_service import Result
 from .feedback import render_feedback
 
 
+@dataclass(frozen=True)
+class _ItemView:
+    """Plain copy of the item fields the display renders."""
+    id: int
+    name: str
+    quantity: int
+    unit: str
+    is_bought: bool
+
+
+@dataclass(frozen=True)
+class _ListView:
+    """Plain copy of the list fields the display renders."""
+    id: int
+    name: str
+    items: Tuple[_ItemView, ...]
+
+
+def _to_view(contents: ListContents) -> _ListView:
+    """
+    Copy list contents into plain values that are safe to cache.
+    
+    The cache pickles its values, and pickled ORM items come back
+    detached and expired, so only the rendered fields are kept.
+    
+    Args:
+        contents: List contents returned by the service
+    """
+    return _ListView(
+        id=contents.id,
+        name=contents.name,
+        items=tuple(
+            _ItemView(
+                id=item.id,
+                name=item.name,
+                quantity=item.quantity,
+                unit=item.unit,
+                is_bought=item.is_bought
+            )
+            for item in contents.items
+        )
+    )
+
+
+class _FetchFailed(Exception):
+    """Carries a failed fetch out of the cache so it is not stored."""
+    
+    def __init__(self, result: Result[ListContents]) -> None:
+        super().__init__(result.error)
+        self.result = result
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _fetch_list(
+    _list_service: ListService,
+    list_id: int,
+    user_id: int,
+    fingerprint: ListFingerprint
+) -> _ListView:
+    """
+    Fetch list contents, cached by the list's fingerprint.
+    
+    The service is excluded from the cache key (leading underscore); the
+    fingerprint changes whenever the list or its items change, so a new
+    fingerprint always misses the cache. Stale fingerprints age out once
+    max_entries is reached, and failures raise so they are never cached.
+    
+    Args:
+        _list_service: Service for managing lists
+        list_id: ID of the list to fetch
+        user_id: ID of the list's owner
+        fingerprint: Current fingerprint of the list
+        
+    Raises:
+        _FetchFailed: If the service could not show the list
+    """
+    result = _list_service.show_list(list_id)
+    if not result.success or result.data is None:
+        raise _FetchFailed(result)
+    return _to_view(result.data)
+
+
+def _get_list_contents(
+    list_service: ListService,
+    list_id: int
+) -> Result[_ListView]:
+    """
+    Get list contents, skipping the full fetch when nothing changed.
+    
+    Args:
+        list_service: Service for managing lists
+        list_id: ID of the list to fetch
+    """
+    fingerprint_result = list_service.get_fingerprint(list_id)
+    if not fingerprint_result.success or fingerprint_result.data is None:
+        result = list_service.show_list(list_id)
+        if not result.success or result.data is None:
+            return cast(Result[_ListView], result)
+        return Result.ok(_to_view(result.data))
+    
+    try:
+        return Result.ok(_fetch_list(
+            list_service,
+            list_id,
+            list_service.user_id,
+            fingerprint_result.data
+        ))
+    except _FetchFailed as e:
+        return cast(Result[_ListView], e.result)
+
+
 def render_list_display(
     list_service: ListService,
     item_service: ItemService,
@@ -22,12 +135,12 @@ def render_list_display(
         list_id: ID of the list to display
     """
     # Get list contents
-    result = list_service.show_list(list_id)
-    if not result.success or not result.data:
-        render_feedback(result.error, type_="error")
+    result = _get_list_contents(list_service, list_id)
+    success, list_contents, error = result.success, result.data, result.error
+    if not success or not list_contents:
+        render_feedback(error, type_="error")
         return
         
-    list_contents = cast(ListContents, result.data)
     st.header(list_contents.name)
     
     if not list_contents.items:
@@ -1,8 +1,8 @@
 """Sidebar component for list navigation and management."""
 import streamlit as st
-from typing import cast, Optional
+from typing import Optional
 
-from baskit.services.list_service import ListService, ListSummary
+from baskit.services.list_service import ListService
 from baskit.services.base_service import Result
 from .feedback import render_feedback
 
@@ -47,16 +47,15 @@ def render_sidebar(list_service: ListService) -> Optional[int]:
         st.divider()
         
         # Get all lists
-        result = list_service.list_all_user_lists()
-        if not result.success or not result.data:
+        lists_result = list_service.list_all_user_lists()
+        lists = lists_result.data
+        if not lists_result.success or not lists:
             render_feedback(
-                result.error,
+                lists_result.error,
                 type_="error",
-                suggestions=result.suggestions
+                suggestions=lists_result.suggestions
             )
             return None
-            
-        lists = cast(list[ListSummary], result.data)
         
         # Default list selection
         st.subheader("רשימת ברירת מחדל")
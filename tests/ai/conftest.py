@@ -1,32 +1,116 @@
 """Test fixtures for GPT integration."""
-import os
+import copy
+from dataclasses import replace
+from functools import lru_cache
+from types import SimpleNamespace
 import pytest
-from unittest.mock import Mock, AsyncMock, MagicMock
-from openai import AsyncOpenAI
-from openai.types.chat import ChatCompletion, ChatCompletionMessage
+from unittest.mock import Mock, AsyncMock
 
-from baskit.services.item_service import ItemService
+from baskit.services.item_service import ItemService, ItemLocation
 from baskit.services.list_service import ListService
 from baskit.services.base_service import Result
 from baskit.models import GroceryList, GroceryItem
 from baskit.ai.models import GPTConfig, GPTContext
-from baskit.ai.call_gpt import GPTHandler
 from baskit.ai.handlers import ToolExecutor
+from baskit.ai.text_to_item import parse_text_to_item
 
 
-# Set mock API key for testing
-os.environ['OPENAI_API_KEY'] = 'sk-test-key'
+# Service attribute names, computed once and used as mock specs so each
+# mock still rejects unknown attributes without re-introspecting the class
+ITEM_SERVICE_SPEC = dir(ItemService)
+LIST_SERVICE_SPEC = dir(ListService)
 
 
-@pytest.fixture
-def mock_openai():
-    """Mock OpenAI client."""
+def _ok(data=None):
+    """Build a successful Result without re-validating known-good data."""
+    return Result.model_construct(
+        success=True,
+        data=data,
+        error="",
+        suggestions=[]
+    )
+
+
+# Canned chat completion returned by the mocked OpenAI client
+class _MockFunction:
+    name = 'add_item'
+    arguments = '{"item_name": "חלב", "quantity": 1, "unit": "יחידה"}'
+
+
+class _MockToolCall:
+    type = 'function'
+    function = _MockFunction
+
+
+class _MockMessage:
+    tool_calls = [_MockToolCall]
+
+
+class _MockChoice:
+    message = _MockMessage
+
+
+class _MockCompletion:
+    choices = [_MockChoice]
+
+
+# Stand-in for GPTHandler in tests that call process_smart_input directly
+class _FakeGPT:
+    """GPT handler returning a canned result and recording its calls."""
+
+    def __init__(self):
+        self.result = None
+        self.error = None
+        self.calls = []
+
+    async def call_with_tools(self, text, context):
+        self.calls.append((text, context))
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _openai_api_key():
+    """Set a mock OpenAI API key for the duration of the test session."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("OPENAI_API_KEY", "sk-test-key")
+        yield
+
+
+@pytest.fixture(scope="session")
+def _openai_mock_template():
+    """Mock OpenAI client, specced against AsyncOpenAI once per session."""
+    # Imported here so tests that never touch GPT don't load the openai SDK
+    from openai import AsyncOpenAI
+    
     mock = AsyncMock(spec=AsyncOpenAI)
     mock.chat.completions.create = AsyncMock()
     return mock
 
 
 @pytest.fixture
+def mock_openai(_openai_mock_template):
+    """Mock OpenAI client."""
+    # Tests set return values and side effects, so clear those as well
+    _openai_mock_template.reset_mock(return_value=True, side_effect=True)
+    return _openai_mock_template
+
+
+@pytest.fixture(scope="session")
+def parse_text():
+    """Parse each distinct text once per session, returning a fresh copy."""
+    cached_parse = lru_cache(maxsize=256)(parse_text_to_item)
+    return lambda text: copy.deepcopy(cached_parse(text))
+
+
+@pytest.fixture
+def mock_gpt():
+    """GPT handler stub; tests set what call_with_tools returns or raises."""
+    return _FakeGPT()
+
+
+@pytest.fixture(scope="session")
 def gpt_config():
     """GPT configuration for testing."""
     return GPTConfig(
@@ -37,9 +121,20 @@ def gpt_config():
     )
 
 
-@pytest.fixture
-def gpt_context():
-    """GPT context for testing."""
+@pytest.fixture(scope="session")
+def api_gpt_config():
+    """GPT configuration for API mode testing."""
+    return GPTConfig(
+        model="gpt-4",
+        temperature=0.0,  # Use zero temperature for deterministic results
+        max_retries=3,
+        timeout=10
+    )
+
+
+@pytest.fixture(scope="session")
+def _gpt_context_template():
+    """Shared GPT context, built once per session."""
     return GPTContext(
         messages=[
             {
@@ -51,16 +146,17 @@ def gpt_context():
 
 
 @pytest.fixture
-def mock_item_service():
-    """Mock item service."""
-    mock = Mock(spec=ItemService)
-    
-    # Add required attributes for ToolService
-    mock.session = Mock()
-    mock.user_id = 1
-    
-    # Create a default item
-    default_item = GroceryItem(
+def gpt_context(_gpt_context_template):
+    """GPT context for testing."""
+    # Handlers only ever reassign context.messages (never mutate the list),
+    # so a shallow copy is enough to keep tests isolated
+    return _gpt_context_template.model_copy()
+
+
+@pytest.fixture
+def sample_models():
+    """Grocery models returned by the mock services, built fresh per test."""
+    milk_item = GroceryItem(
         id=1,
         name="חלב",
         quantity=1,
@@ -69,32 +165,32 @@ def mock_item_service():
         is_bought=False
     )
     
-    # Create a default list
-    default_list = GroceryList(
-        id=1,
-        name="רשימה ראשית",
-        owner_id=1,
-        items=[default_item]
-    )
-    
-    # Setup default behaviors with proper data structures
-    mock.add_item.return_value = Result(
-        success=True,
-        data=default_item,
-        error="",
-        suggestions=[]
-    )
-    
-    mock.remove_item.return_value = Result(
-        success=True,
-        data=None,
-        error="",
-        suggestions=[]
-    )
-    
-    mock.update_item.return_value = Result(
-        success=True,
-        data=GroceryItem(
+    return SimpleNamespace(
+        milk_item=milk_item,
+        # Where the milk item lives, as returned by item lookups
+        milk_location=ItemLocation(
+            list_id=1,
+            list_name="רשימה ראשית",
+            item_id=1,
+            quantity=1,
+            unit="יחידה",
+            is_bought=False
+        ),
+        # Default list holding the milk item
+        main_list=GroceryList(
+            id=1,
+            name="רשימה ראשית",
+            owner_id=1,
+            items=[milk_item]
+        ),
+        # Default list without items
+        empty_list=GroceryList(
+            id=1,
+            name="רשימה ראשית",
+            owner_id=1,
+            items=[]
+        ),
+        updated_milk=GroceryItem(
             id=1,
             name="חלב",
             quantity=2,
@@ -102,13 +198,7 @@ def mock_item_service():
             list_id=1,
             is_bought=False
         ),
-        error="",
-        suggestions=[]
-    )
-    
-    mock.mark_bought.return_value = Result(
-        success=True,
-        data=GroceryItem(
+        bought_milk=GroceryItem(
             id=1,
             name="חלב",
             quantity=1,
@@ -116,112 +206,145 @@ def mock_item_service():
             list_id=1,
             is_bought=True
         ),
-        error="",
-        suggestions=[]
+        new_list=GroceryList(
+            id=2,
+            name="רשימה חדשה",
+            owner_id=1,
+            items=[]
+        )
     )
-    
-    # Setup get_item_locations with proper data structure
-    mock.get_item_locations.return_value = Result(
-        success=True,
-        data=[(default_item, default_list)],
-        error="",
-        suggestions=[]
+
+
+@pytest.fixture
+def sample_results(sample_models):
+    """Successful service results returned by the mock services."""
+    return SimpleNamespace(
+        add_item=_ok(sample_models.milk_item),
+        update_item=_ok(sample_models.updated_milk),
+        mark_bought=_ok(sample_models.bought_milk),
+        item_locations=_ok([sample_models.milk_location]),
+        lists=_ok([sample_models.empty_list]),
+        default_list=_ok(sample_models.empty_list),
+        create_list=_ok(sample_models.new_list),
+        show_list=_ok(sample_models.main_list),
+        resolve_list=_ok(sample_models.empty_list.id),
+        resolve_item=_ok((1, sample_models.milk_location))
     )
-    
-    return mock
+
+
+@pytest.fixture(scope="session")
+def ok_result():
+    """Factory for successful results, for tests that set up their own mocks."""
+    return _ok
 
 
 @pytest.fixture
-def mock_list_service():
-    """Mock list service."""
-    mock = Mock(spec=ListService)
-    
-    # Create a default list
-    default_list = GroceryList(
+def default_grocery_list():
+    """Default list targeted by smart input requests."""
+    return GroceryList(
         id=1,
-        name="רשימה ראשית",
+        name="רשימת קניות",
         owner_id=1,
         items=[]
     )
-    
-    # Setup default behaviors with proper data structures
-    mock.get_lists.return_value = Result(
-        success=True,
-        data=[default_list],
-        error="",
-        suggestions=[]
+
+
+@pytest.fixture
+def target_grocery_list():
+    """Named list targeted explicitly by smart input requests."""
+    return GroceryList(
+        id=2,
+        name="רשימת שבת",
+        owner_id=1,
+        items=[]
     )
+
+
+@pytest.fixture
+def default_item_location(sample_models):
+    """Location of the milk item in the default list."""
+    return sample_models.milk_location
+
+
+@pytest.fixture
+def mock_tool_service_factory(default_item_location):
+    """Factory for tool services that resolve to a given list."""
+    def _make(grocery_list):
+        service = Mock()
+        service.resolve_list.return_value = _ok(grocery_list.id)
+        service.resolve_item.return_value = _ok((1, replace(
+            default_item_location,
+            list_id=grocery_list.id,
+            list_name=grocery_list.name
+        )))
+        return service
+    return _make
+
+
+@pytest.fixture(scope="module")
+def _item_service_template():
+    """Mock item service, built once per module."""
+    mock = Mock(spec=ITEM_SERVICE_SPEC)
     
-    mock.get_default_list.return_value = Result(
-        success=True,
-        data=default_list,
-        error="",
-        suggestions=[]
-    )
+    # Add required attributes for ToolService
+    mock.session = SimpleNamespace()  # Only stored by ToolService, never used
+    mock.user_id = 1
+    return mock
+
+
+@pytest.fixture
+def mock_item_service(_item_service_template, sample_results):
+    """Mock item service."""
+    mock = _item_service_template
+    # Tests override return values and side effects, so clear those as well
+    mock.reset_mock(return_value=True, side_effect=True)
     
-    mock.create_list.return_value = Result(
-        success=True,
-        data=GroceryList(
-            id=2,
-            name="רשימה חדשה",
-            owner_id=1,
-            items=[]
-        ),
-        error="",
-        suggestions=[]
-    )
+    # Setup default behaviors with proper data structures
+    mock.add_item.return_value = sample_results.add_item
+    mock.remove_item.return_value = _ok()
+    mock.update_item.return_value = sample_results.update_item
+    mock.mark_bought.return_value = sample_results.mark_bought
+    mock.get_item_locations.return_value = sample_results.item_locations
     
-    mock.show_list.return_value = Result(
-        success=True,
-        data=GroceryList(
-            id=1,
-            name="רשימה ראשית",
-            owner_id=1,
-            items=[
-                GroceryItem(
-                    id=1,
-                    name="חלב",
-                    quantity=1,
-                    unit="יחידה",
-                    list_id=1,
-                    is_bought=False
-                )
-            ]
-        ),
-        error="",
-        suggestions=[]
-    )
+    return mock
+
+
+@pytest.fixture(scope="module")
+def _list_service_template():
+    """Mock list service, built once per module."""
+    return Mock(spec=LIST_SERVICE_SPEC)
+
+
+@pytest.fixture
+def mock_list_service(_list_service_template, sample_results):
+    """Mock list service."""
+    mock = _list_service_template
+    mock.reset_mock(return_value=True, side_effect=True)
+    
+    # Setup default behaviors with proper data structures
+    mock.get_lists.return_value = sample_results.lists
+    mock.get_default_list.return_value = sample_results.default_list
+    mock.create_list.return_value = sample_results.create_list
+    mock.show_list.return_value = sample_results.show_list
     
     return mock
 
 
+@pytest.fixture(scope="module")
+def _tool_service_template():
+    """Mock tool service, built once per module."""
+    return Mock()
+
+
 @pytest.fixture
-def mock_tool_service():
+def mock_tool_service(_tool_service_template, sample_results):
     """Mock tool service."""
-    mock = Mock()
-    
-    # Create a default list
-    default_list = GroceryList(
-        id=1,
-        name="רשימה ראשית",
-        owner_id=1,
-        items=[]
-    )
+    mock = _tool_service_template
+    mock.reset_mock(return_value=True, side_effect=True)
     
     # Setup default behaviors with proper data structures
-    mock.resolve_list.return_value = Result(
-        success=True,
-        data=default_list.id,
-        error="",
-        suggestions=[]
-    )
-    
-    mock.resolve_item.return_value = Result(
-        success=True,
-        data=(1, default_list),
-        error="",
-        suggestions=[]
-    )
+    mock.resolve_list.return_value = sample_results.resolve_list
+    mock.resolve_item.return_value = sample_results.resolve_item
     
     return mock
 
@@ -229,59 +352,29 @@ def mock_tool_service():
 @pytest.fixture
 def gpt_handler(mock_openai, gpt_config):
     """GPT handler for testing."""
+    from baskit.ai.call_gpt import GPTHandler
+    
     handler = GPTHandler(gpt_config)
     handler.client = mock_openai
     handler.use_mock = False  # Disable mock mode for tests
     
-    # Mock tool_calls attribute
-    mock_tool_calls = [
-        type(
-            'ToolCall',
-            (),
-            {
-                'type': 'function',
-                'function': type(
-                    'Function',
-                    (),
-                    {
-                        'name': 'add_item',
-                        'arguments': '{"item_name": "חלב", "quantity": 1, "unit": "יחידה"}'
-                    }
-                )
-            }
-        )
-    ]
-    
-    # Mock message attribute
-    mock_message = type(
-        'Message',
-        (),
-        {
-            'tool_calls': mock_tool_calls
-        }
-    )
-    
-    # Mock choice attribute
-    mock_choice = type(
-        'Choice',
-        (),
-        {
-            'message': mock_message
-        }
-    )
-    
     # Set up mock response
-    mock_openai.chat.completions.create.return_value = type(
-        'ChatCompletion',
-        (),
-        {
-            'choices': [mock_choice]
-        }
-    )
+    mock_openai.chat.completions.create.return_value = _MockCompletion
     
     return handler
 
 
+@pytest.fixture
+def api_gpt_handler(mock_openai, api_gpt_config):
+    """GPT handler in API mode with a mocked client."""
+    from baskit.ai.call_gpt import GPTHandler
+    
+    handler = GPTHandler(api_gpt_config)
+    handler.client = mock_openai
+    handler.use_mock = False  # Explicitly use API mode
+    return handler
+
+
 @pytest.fixture
 def tool_executor(mock_item_service, mock_list_service, mock_tool_service):
     """Tool executor for testing."""
@@ -292,42 +385,3 @@ def tool_executor(mock_item_service, mock_list_service, mock_tool_service):
     executor.tool_service = mock_tool_service  # Override the tool service
     executor.allow_duplicates = True  # Allow duplicates for testing
     return executor
-
-
-@pytest.fixture
-def hebrew_inputs():
-    """Sample Hebrew inputs for testing."""
-    return [
-        (
-            "תוסיף חלב",
-            {
-                'name': 'add_item',
-                'arguments': {
-                    'item_name': 'חלב',
-                    'quantity': 1,
-                    'unit': 'יחידה'
-                }
-            }
-        ),
-        (
-            "תוריד 2 ביצים",
-            {
-                'name': 'update_quantity',
-                'arguments': {
-                    'item_name': 'ביצים',
-                    'quantity': 2,
-                    'unit': 'יחידה'
-                }
-            }
-        ),
-        (
-            "סמן שקניתי חלב",
-            {
-                'name': 'mark_bought',
-                'arguments': {
-                    'item_name': 'חלב',
-                    'is_bought': True
-                }
-            }
-        )
-    ] 
\ No newline at end of file
@@ -1,94 +1,205 @@
 """Integration tests for GPT and tool execution."""
+import json
+from dataclasses import dataclass
+from types import MappingProxyType, SimpleNamespace
+from typing import List
+
 import pytest
-from unittest.mock import ANY, patch, AsyncMock, Mock
-from openai.types.chat import ChatCompletionMessage
 
-from baskit.ai.errors import APIError, ValidationError, ToolExecutionError, ToolExecutionResult
+from baskit.ai.errors import APIError, ValidationError, ToolExecutionResult
 from baskit.services.base_service import Result
-from baskit.web.app import process_smart_input
-from baskit.ai.models import GPTContext
-from baskit.models import GroceryList, GroceryItem
-from baskit.ai.handlers import ToolExecutor
-from baskit.services.item_service import ItemLocation
+
+
+# Minimal stand-ins for the OpenAI chat completion response objects
+@dataclass(frozen=True)
+class FakeFunction:
+    name: str
+    arguments: str
+
+
+@dataclass(frozen=True)
+class FakeToolCall:
+    type: str
+    function: FakeFunction
+
+
+@dataclass(frozen=True)
+class FakeMessage:
+    tool_calls: List[FakeToolCall]
+
+
+@dataclass(frozen=True)
+class FakeChoice:
+    message: FakeMessage
+
+
+@dataclass(frozen=True)
+class FakeCompletion:
+    choices: List[FakeChoice]
+
+
+# Hebrew inputs and the tool call GPT is expected to produce for them
+_RAW_HEBREW_CASES = (
+    (
+        "תוסיף חלב",
+        {
+            'name': 'add_item',
+            'arguments': {
+                'item_name': 'חלב',
+                'quantity': 1,
+                'unit': 'יחידה'
+            }
+        }
+    ),
+    (
+        "תוריד 2 ביצים",
+        {
+            'name': 'update_quantity',
+            'arguments': {
+                'item_name': 'ביצים',
+                'quantity': 2,
+                'unit': 'יחידה'
+            }
+        }
+    ),
+    (
+        "סמן שקניתי חלב",
+        {
+            'name': 'mark_bought',
+            'arguments': {
+                'item_name': 'חלב',
+                'is_bought': True
+            }
+        }
+    )
+)
+
+# Shared by every parametrized case, so expose the tool calls read-only
+HEBREW_CASES = tuple(
+    (
+        text,
+        MappingProxyType({
+            'name': expected['name'],
+            'arguments': MappingProxyType(expected['arguments'])
+        })
+    )
+    for text, expected in _RAW_HEBREW_CASES
+)
+
+# Expected arguments as the JSON string the OpenAI API returns, serialized once
+HEBREW_CASE_ARGUMENTS_JSON = tuple(
+    json.dumps(dict(expected['arguments']), ensure_ascii=False)
+    for _, expected in HEBREW_CASES
+)
+
+# ASCII test ids for HEBREW_CASES, so pytest doesn't escape Hebrew into ids
+HEBREW_CASE_IDS = ("add_milk", "update_eggs", "mark_bought_milk")
+
+# The mock GPT handler only produces add_item calls
+ADD_ITEM_CASES = [
+    pytest.param(text, expected, id=case_id)
+    for case_id, (text, expected) in zip(HEBREW_CASE_IDS, HEBREW_CASES)
+    if expected['name'] == 'add_item'
+]
+
+# Tool calls the default mocks can serve: (tool name, arguments,
+# expected values by key path into result.data, expected error substring)
+TOOL_CASES = [
+    (
+        'add_item',
+        {'item_name': 'חלב', 'quantity': 1, 'unit': 'יחידה'},
+        {
+            ('item', 'name'): 'חלב',
+            ('item', 'quantity'): 1,
+            ('item', 'unit'): 'יחידה'
+        },
+        None
+    ),
+    (
+        'mark_bought',
+        {'item_name': 'חלב', 'is_bought': True},
+        {('item', 'is_bought'): True},
+        None
+    ),
+    (
+        'create_list',
+        {'name': 'רשימה חדשה'},
+        {('list', 'name'): 'רשימה חדשה'},
+        None
+    ),
+    (
+        'unsupported_tool',
+        {},
+        None,
+        'לא נתמך'
+    )
+]
 
 
 @pytest.mark.asyncio
+@pytest.mark.parametrize("text,expected", ADD_ITEM_CASES)
 async def test_gpt_handler_mock_mode(
     gpt_handler,  # Uses mock mode by default
     gpt_context,
-    hebrew_inputs
+    text,
+    expected
 ):
     """Test GPT handler in mock mode."""
-    text, expected = hebrew_inputs[0]  # Use first test case
-    
     # Ensure mock mode is enabled
     gpt_handler.use_mock = True
     
     result = await gpt_handler.call_with_tools(text, gpt_context)
     
     assert result.success
-    assert result.data['tool_calls'][0]['name'] == expected['name']
-    assert result.data['tool_calls'][0]['arguments'] == expected['arguments']
-    assert result.data['confidence'] == 1.0  # Mock mode always uses 1.0 confidence
-    assert result.metadata['mock_mode'] is True
+    tool_call = result.data['tool_calls'][0]
+    # Mock mode always uses 1.0 confidence
+    assert (
+        tool_call['name'],
+        tool_call['arguments'],
+        result.data['confidence'],
+        result.metadata['mock_mode']
+    ) == (expected['name'], expected['arguments'], 1.0, True)
 
 
 @pytest.mark.asyncio
-async def test_gpt_handler_api_mode(
-    api_gpt_handler,
-    gpt_context,
-    hebrew_inputs
-):
+async def test_gpt_handler_api_mode(api_gpt_handler, gpt_context):
     """Test GPT handler in API mode."""
-    text, expected = hebrew_inputs[0]  # Use first test case
-    
-    # Setup mock response
-    mock_tool_calls = [
-        type(
-            'ToolCall',
-            (),
-            {
-                'type': 'function',
-                'function': type(
-                    'Function',
-                    (),
-                    {
-                        'name': expected['name'],
-                        'arguments': '{"item_name": "חלב", "quantity": 1, "unit": "יחידה"}'
-                    }
+    # Setup one mock response per Hebrew case, returned in order
+    api_gpt_handler.client.chat.completions.create.side_effect = [
+        FakeCompletion(
+            choices=[
+                FakeChoice(
+                    message=FakeMessage(
+                        tool_calls=[
+                            FakeToolCall(
+                                type='function',
+                                function=FakeFunction(
+                                    name=expected['name'],
+                                    arguments=arguments_json
+                                )
+                            )
+                        ]
+                    )
                 )
-            }
+            ]
+        )
+        for (_, expected), arguments_json in zip(
+            HEBREW_CASES, HEBREW_CASE_ARGUMENTS_JSON
         )
     ]
     
-    # Mock message attribute
-    mock_message = type(
-        'Message',
-        (),
-        {
-            'tool_calls': mock_tool_calls
-        }
-    )
-    
-    # Mock choice attribute
-    mock_choice = type(
-        'Choice',
-        (),
-        {
-            'message': mock_message
-        }
-    )
-    
-    # Set up mock response
-    api_gpt_handler.client.chat.completions.create.return_value.choices = [mock_choice]
-    
-    result = await api_gpt_handler.call_with_tools(text, gpt_context)
-    
-    assert result.success
-    assert result.data['tool_calls'][0]['name'] == expected['name']
-    assert result.data['tool_calls'][0]['arguments'] == expected['arguments']
-    assert result.data['confidence'] == 1.0  # Using temperature=0.0
-    assert result.metadata['mock_mode'] is False
+    for text, expected in HEBREW_CASES:
+        result = await api_gpt_handler.call_with_tools(text, gpt_context)
+        
+        assert result.success
+        tool_call = result.data['tool_calls'][0]
+        # Using temperature=0.0
+        assert (
+            tool_call['name'],
+            tool_call['arguments'],
+            result.data['confidence'],
+            result.metadata['mock_mode']
+        ) == (expected['name'], expected['arguments'], 1.0, False)
 
 
 @pytest.mark.asyncio
@@ -107,23 +218,39 @@ async def test_gpt_handler_api_error(api_gpt_handler, gpt_context):
 
 
 @pytest.mark.asyncio
-async def test_tool_executor_add_item(tool_executor, gpt_context):
-    """Test add_item tool execution."""
+@pytest.mark.parametrize(
+    "tool_name,arguments,expected_data,expected_error",
+    TOOL_CASES,
+    ids=[case[0] for case in TOOL_CASES]
+)
+async def test_tool_executor(
+    tool_executor,
+    gpt_context,
+    tool_name,
+    arguments,
+    expected_data,
+    expected_error
+):
+    """Test tool execution for tools that need no extra mock setup."""
     tool_call = {
-        'name': 'add_item',
-        'arguments': {
-            'item_name': 'חלב',
-            'quantity': 1,
-            'unit': 'יחידה'
-        }
+        'name': tool_name,
+        'arguments': arguments
     }
     
     result = await tool_executor.execute(tool_call, gpt_context)
     
+    if expected_error:
+        assert not result.success
+        assert expected_error in result.error
+        assert len(result.suggestions) > 0
+        return
+    
     assert result.success
-    assert result.data['item']['name'] == 'חלב'
-    assert result.data['item']['quantity'] == 1
-    assert result.data['item']['unit'] == 'יחידה'
+    for path, expected in expected_data.items():
+        value = result.data
+        for key in path:
+            value = value[key]
+        assert value == expected
 
 
 @pytest.mark.asyncio
@@ -207,52 +334,6 @@ async def test_tool_executor_invalid_hebrew(tool_executor, gpt_context):
     assert 'hebrew' in result.error.lower() or 'עברית' in result.error.lower()
 
 
-@pytest.mark.asyncio
-async def test_tool_executor_mark_bought(tool_executor, gpt_context):
-    """Test mark_bought tool execution."""
-    # Mock the tool service to return a valid item
-    default_item = GroceryItem(
-        id=1,
-        name="חלב",
-        quantity=1,
-        unit="יחידה",
-        list_id=1,
-        is_bought=False
-    )
-    default_list = GroceryList(
-        id=1,
-        name="רשימה ראשית",
-        owner_id=1,
-        items=[default_item]
-    )
-    tool_executor.tool_service.resolve_item.return_value = Result(
-        success=True,
-        data=(1, ItemLocation(
-            item_id=1,
-            list_id=default_list.id,
-            list_name=default_list.name,
-            quantity=default_item.quantity,
-            unit=default_item.unit,
-            is_bought=False
-        )),
-        error="",
-        suggestions=[]
-    )
-    
-    tool_call = {
-        'name': 'mark_bought',
-        'arguments': {
-            'item_name': 'חלב',
-            'is_bought': True
-        }
-    }
-    
-    result = await tool_executor.execute(tool_call, gpt_context)
-    
-    assert result.success
-    assert result.data['item']['is_bought']
-
-
 @pytest.mark.asyncio
 async def test_tool_executor_show_list(tool_executor, gpt_context):
     """Test show_list tool execution."""
@@ -271,55 +352,28 @@ async def test_tool_executor_show_list(tool_executor, gpt_context):
     assert len(result.data['list']['items']) > 0
 
 
+@pytest.mark.slow
 @pytest.mark.asyncio
-async def test_tool_executor_create_list(tool_executor, gpt_context):
-    """Test create_list tool execution."""
-    tool_call = {
-        'name': 'create_list',
-        'arguments': {
-            'name': 'רשימה חדשה'
-        }
-    }
-    
-    result = await tool_executor.execute(tool_call, gpt_context)
-    
-    assert result.success
-    assert result.data['list']['name'] == 'רשימה חדשה'
-
-
-@pytest.mark.asyncio
-async def test_tool_executor_unsupported_tool(tool_executor, gpt_context):
-    """Test handling of unsupported tool."""
-    tool_call = {
-        'name': 'unsupported_tool',
-        'arguments': {}
-    }
-    
-    result = await tool_executor.execute(tool_call, gpt_context)
-    
-    assert not result.success
-    assert 'לא נתמך' in result.error
-    assert len(result.suggestions) > 0
-
-
-@pytest.mark.asyncio
+@pytest.mark.parametrize("text,expected", ADD_ITEM_CASES)
 async def test_end_to_end_flow(
     gpt_handler,  # Uses mock mode by default
     tool_executor,
     gpt_context,
-    hebrew_inputs
+    text,
+    expected
 ):
     """Test complete flow from GPT to tool execution."""
-    text, expected = hebrew_inputs[0]
-    
     # Ensure mock mode is enabled
     gpt_handler.use_mock = True
     
     # Get tool calls from GPT
     gpt_result = await gpt_handler.call_with_tools(text, gpt_context)
     assert gpt_result.success
-    assert gpt_result.data['confidence'] == 1.0  # Mock mode always uses 1.0 confidence
-    assert gpt_result.metadata['mock_mode'] is True
+    # Mock mode always uses 1.0 confidence
+    assert (
+        gpt_result.data['confidence'],
+        gpt_result.metadata['mock_mode']
+    ) == (1.0, True)
     
     # Execute tool calls
     tool_calls = gpt_result.data['tool_calls']
@@ -327,24 +381,35 @@ async def test_end_to_end_flow(
     
     tool_result = await tool_executor.execute(tool_calls[0], gpt_context)
     assert tool_result.success
-    assert tool_result.data['item']['name'] == 'חלב'
-    assert tool_result.data['item']['quantity'] == 1
-    assert tool_result.data['item']['unit'] == 'יחידה' 
+    item = tool_result.data['item']
+    assert (item['name'], item['quantity'], item['unit']) == ('חלב', 1, 'יחידה')
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_streamlit():
-    """Mock Streamlit session state."""
-    with patch('streamlit.session_state') as mock_state:
-        mock_state.session_id = 'test_session'
+    """Mock Streamlit session state once for the module."""
+    # process_smart_input only reads the session id
+    mock_state = SimpleNamespace(session_id='test_session')
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr('streamlit.session_state', mock_state)
         yield mock_state
 
+
+@pytest.fixture(scope="module")
+def process_smart_input(mock_streamlit):
+    """Smart input entry point, with Streamlit session state mocked."""
+    # The web app pulls in Streamlit, so only import it for tests that need it
+    from baskit.web.app import process_smart_input
+    return process_smart_input
+
 @pytest.mark.asyncio
-async def test_smart_input_processing_success(mocker, mock_streamlit, mock_item_service, mock_list_service):
+async def test_smart_input_processing_success(
+    mock_gpt, process_smart_input, mock_item_service, mock_list_service,
+    tool_executor, default_grocery_list, mock_tool_service_factory, ok_result
+):
     """Test successful processing of smart input."""
     # Arrange
-    mock_gpt = mocker.Mock()
-    mock_gpt.call_with_tools = AsyncMock(return_value=ToolExecutionResult(
+    mock_gpt.result = ToolExecutionResult(
         success=True,
         message="הוספתי טופו לרשימה",
         data={
@@ -359,62 +424,16 @@ async def test_smart_input_processing_success(mocker, mock_streamlit, mock_item_
                 }
             ]
         }
-    ))
+    )
     
     # Set up default list
-    default_list = GroceryList(
-        id=1,
-        name="רשימת קניות",
-        owner_id=1,
-        items=[]
-    )
-    mock_list_service.get_default_list.return_value = Result(
-        success=True,
-        data=default_list,
-        error="",
-        suggestions=[]
-    )
-    mock_list_service.show_list.return_value = Result(
-        success=True,
-        data=default_list,
-        error="",
-        suggestions=[]
-    )
-    mock_list_service.get_lists.return_value = Result(
-        success=True,
-        data=[default_list],
-        error="",
-        suggestions=[]
-    )
+    default_list = default_grocery_list
+    mock_list_service.get_default_list.return_value = ok_result(default_list)
+    mock_list_service.show_list.return_value = ok_result(default_list)
+    mock_list_service.get_lists.return_value = ok_result([default_list])
     
     # Mock the tool service to return a valid list
-    mock_tool_service = Mock()
-    mock_tool_service.resolve_list.return_value = Result(
-        success=True,
-        data=default_list.id,
-        error="",
-        suggestions=[]
-    )
-    mock_tool_service.resolve_item.return_value = Result(
-        success=True,
-        data=(1, ItemLocation(
-            item_id=1,
-            list_id=default_list.id,
-            list_name=default_list.name,
-            quantity=1,
-            unit="יחידה",
-            is_bought=False
-        )),
-        error="",
-        suggestions=[]
-    )
-    
-    # Create a tool executor with the mocked services
-    tool_executor = ToolExecutor(
-        item_service=mock_item_service,
-        list_service=mock_list_service
-    )
-    tool_executor.tool_service = mock_tool_service
+    tool_executor.tool_service = mock_tool_service_factory(default_list)
     
     # Act
     result = await process_smart_input(
@@ -431,15 +450,16 @@ async def test_smart_input_processing_success(mocker, mock_streamlit, mock_item_
     assert "טופו" in result.message
 
 @pytest.mark.asyncio
-async def test_smart_input_processing_failure(mocker, mock_streamlit, mock_item_service, mock_list_service):
+async def test_smart_input_processing_failure(
+    mock_gpt, process_smart_input, mock_item_service, mock_list_service
+):
     """Test failed processing of smart input."""
     # Arrange
-    mock_gpt = mocker.Mock()
-    mock_gpt.call_with_tools = AsyncMock(return_value=ToolExecutionResult(
+    mock_gpt.result = ToolExecutionResult(
         success=False,
         message="לא הצלחתי להבין את הבקשה",
         suggestions=["נסה לכתוב בעברית בלבד"]
-    ))
+    )
     
     # Act
     result = await process_smart_input(
@@ -453,14 +473,15 @@ async def test_smart_input_processing_failure(mocker, mock_streamlit, mock_item_
     # Assert
     assert not result.success
     assert len(result.suggestions) > 0
-    mock_gpt.call_with_tools.assert_called_once()
+    assert len(mock_gpt.calls) == 1
 
 @pytest.mark.asyncio
-async def test_smart_input_processing_error(mocker, mock_streamlit, mock_item_service, mock_list_service):
+async def test_smart_input_processing_error(
+    mock_gpt, process_smart_input, mock_item_service, mock_list_service
+):
     """Test error handling in smart input processing."""
     # Arrange
-    mock_gpt = mocker.Mock()
-    mock_gpt.call_with_tools = AsyncMock(side_effect=Exception("Test error"))
+    mock_gpt.error = Exception("Test error")
     
     # Act
     result = await process_smart_input(
@@ -475,14 +496,17 @@ async def test_smart_input_processing_error(mocker, mock_streamlit, mock_item_se
     assert not result.success
     assert "שגיאה" in result.message
     assert len(result.suggestions) > 0
-    mock_gpt.call_with_tools.assert_called_once()
+    assert len(mock_gpt.calls) == 1
 
 @pytest.mark.asyncio
-async def test_smart_input_with_context(mocker, mock_streamlit, mock_item_service, mock_list_service):
+async def test_smart_input_with_context(
+    mock_gpt, process_smart_input, mock_item_service, mock_list_service,
+    tool_executor, default_grocery_list, target_grocery_list,
+    mock_tool_service_factory, ok_result
+):
     """Test smart input processing with list context."""
     # Arrange
-    mock_gpt = mocker.Mock()
-    mock_gpt.call_with_tools = AsyncMock(return_value=ToolExecutionResult(
+    mock_gpt.result = ToolExecutionResult(
         success=True,
         message="הוספתי טופו לרשימת שבת",
         data={
@@ -498,68 +522,17 @@ async def test_smart_input_with_context(mocker, mock_streamlit, mock_item_servic
                 }
             ]
         }
-    ))
+    )
     
     # Set up lists
-    target_list = GroceryList(
-        id=2,
-        name="רשימת שבת",
-        owner_id=1,
-        items=[]
-    )
-    default_list = GroceryList(
-        id=1,
-        name="רשימה ראשית",
-        owner_id=1,
-        items=[]
-    )
-    mock_list_service.get_lists.return_value = Result(
-        success=True,
-        data=[default_list, target_list],
-        error="",
-        suggestions=[]
-    )
-    mock_list_service.show_list.return_value = Result(
-        success=True,
-        data=target_list,
-        error="",
-        suggestions=[]
-    )
-    mock_list_service.get_default_list.return_value = Result(
-        success=True,
-        data=default_list,
-        error="",
-        suggestions=[]
-    )
+    target_list = target_grocery_list
+    default_list = default_grocery_list
+    mock_list_service.get_lists.return_value = ok_result([default_list, target_list])
+    mock_list_service.show_list.return_value = ok_result(target_list)
+    mock_list_service.get_default_list.return_value = ok_result(default_list)
     
     # Mock the tool service to return a valid list
-    mock_tool_service = Mock()
-    mock_tool_service.resolve_list.return_value = Result(
-        success=True,
-        data=target_list.id,
-        error="",
-        suggestions=[]
-    )
-    mock_tool_service.resolve_item.return_value = Result(
-        success=True,
-        data=(1, ItemLocation(
-            item_id=1,
-            list_id=target_list.id,
-            list_name=target_list.name,
-            quantity=1,
-            unit="יחידה",
-            is_bought=False
-        )),
-        error="",
-        suggestions=[]
-    )
-    
-    # Create a tool executor with the mocked services
-    tool_executor = ToolExecutor(
-        item_service=mock_item_service,
-        list_service=mock_list_service
-    )
-    tool_executor.tool_service = mock_tool_service
+    tool_executor.tool_service = mock_tool_service_factory(target_list)
     
     # Act
     result = await process_smart_input(
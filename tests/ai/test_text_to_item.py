@@ -1,10 +1,9 @@
 """Tests for the text-to-item parser."""
-from baskit.ai.text_to_item import parse_text_to_item
 
-def test_parse_text_to_item_basic():
+def test_parse_text_to_item_basic(parse_text):
     """Test basic text parsing with a simple Hebrew input."""
     text = "קניתי מלפפונים"
-    result = parse_text_to_item(text)
+    result = parse_text(text)
     
     assert isinstance(result, dict)
     assert "item" in result
@@ -17,9 +16,9 @@ def test_parse_text_to_item_basic():
     assert isinstance(result["confidence"], float)
     assert 0 <= result["confidence"] <= 1
 
-def test_parse_text_to_item_structure():
+def test_parse_text_to_item_structure(parse_text):
     """Test that the parser returns the expected data structure."""
-    result = parse_text_to_item("test")
+    result = parse_text("test")
     
     expected_keys = {"item", "quantity", "unit", "confidence", "original_text"}
     assert set(result.keys()) == expected_keys
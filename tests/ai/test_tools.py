@@ -1,7 +1,6 @@
 """Tests for AI tools implementation."""
 import pytest
 from typing import Dict, Any
-from datetime import datetime, UTC
 
 from baskit.ai.tools import (
     add_item,
@@ -27,8 +26,14 @@ from baskit.ai.tools import (
 )
 
 
+# Fragments of the tools' Hebrew error messages
+ERR_NOT_FOUND = "לא מצאתי"
+ERR_QUANTITY_TOO_HIGH = "99"
+ERR_ALREADY_EXISTS = "כבר קיימת"
+
+
 @pytest.fixture
-def tools_setup(tool_service):
+def tools_setup(tool_service, bulk_add_items):
     """Setup common test data."""
     # Create a test list
     list_result = tool_service.list_service.create_list("רשימת בדיקה")
@@ -36,16 +41,15 @@ def tools_setup(tool_service):
     list_id = list_result.data.id
     
     # Add some items
-    item1 = tool_service.item_service.add_item(list_id, "חלב", 1, "ליטר")
-    assert item1.success
-    
-    item2 = tool_service.item_service.add_item(list_id, "לחם", 2, "יחידה")
-    assert item2.success
+    items = bulk_add_items(list_id, [
+        ("חלב", 1, "ליטר"),
+        ("לחם", 2, "יחידה")
+    ])
     
     return {
         "list_id": list_id,
         "list_name": "רשימת בדיקה",
-        "items": [item1.data, item2.data]
+        "items": items
     }
 
 
@@ -89,7 +93,7 @@ def test_add_item(tool_service, tools_setup):
         )
     )
     assert_tool_error(result)
-    assert "99" in result["message"]
+    assert ERR_QUANTITY_TOO_HIGH in result["message"]
 
 
 def test_update_item(tool_service, tools_setup):
@@ -174,7 +178,7 @@ def test_reduce_quantity(tool_service, tools_setup):
         )
     )
     assert_tool_error(result)
-    assert "לא מצאתי" in result["message"]
+    assert ERR_NOT_FOUND in result["message"]
 
 
 def test_delete_item(tool_service, tools_setup):
@@ -199,7 +203,7 @@ def test_delete_item(tool_service, tools_setup):
         )
     )
     assert_tool_error(result)
-    assert "לא מצאתי" in result["message"]
+    assert ERR_NOT_FOUND in result["message"]
 
 
 def test_mark_item_bought(tool_service, tools_setup):
@@ -225,7 +229,7 @@ def test_mark_item_bought(tool_service, tools_setup):
         )
     )
     assert_tool_error(result)
-    assert "לא מצאתי" in result["message"]
+    assert ERR_NOT_FOUND in result["message"]
 
 
 def test_create_list(tool_service):
@@ -244,7 +248,7 @@ def test_create_list(tool_service):
         CreateList(list_name="רשימה חדשה")
     )
     assert_tool_error(result)
-    assert "כבר קיימת" in result["message"]
+    assert ERR_ALREADY_EXISTS in result["message"]
 
 
 def test_delete_list(tool_service, tools_setup):
@@ -266,7 +270,7 @@ def test_delete_list(tool_service, tools_setup):
         DeleteList(list_name="רשימה לא קיימת")
     )
     assert_tool_error(result)
-    assert "לא מצאתי" in result["message"]
+    assert ERR_NOT_FOUND in result["message"]
 
 
 def test_show_list(tool_service, tools_setup):
@@ -286,7 +290,7 @@ def test_show_list(tool_service, tools_setup):
         ShowList(list_name="רשימה לא קיימת")
     )
     assert_tool_error(result)
-    assert "לא מצאתי" in result["message"]
+    assert ERR_NOT_FOUND in result["message"]
 
 
 def test_set_default_list(tool_service, tools_setup):
@@ -306,4 +310,4 @@ def test_set_default_list(tool_service, tools_setup):
         SetDefaultList(list_name="רשימה לא קיימת")
     )
     assert_tool_error(result)
-    assert "לא מצאתי" in result["message"] 
\ No newline at end of file
+    assert ERR_NOT_FOUND in result["message"] 
\ No newline at end of file
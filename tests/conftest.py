@@ -1,66 +1,85 @@
 """Test configuration and fixtures for BaskIt."""
+from contextlib import contextmanager
+from typing import Iterator, List
+
 import pytest
-from unittest.mock import Mock, AsyncMock
-from sqlalchemy import create_engine, event, inspect
-from sqlalchemy.orm import Session, sessionmaker
-from sqlalchemy.engine import Engine
+import pytest_asyncio
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.orm import Session, configure_mappers
+from sqlalchemy.pool import StaticPool
 import sqlite3
 
 from baskit.models import Base, User, GroceryList, GroceryItem
 from baskit.services.list_service import ListService
 from baskit.services.item_service import ItemService
-from baskit.ai.call_gpt import GPTConfig, GPTContext, GPTHandler
-from baskit.ai.handlers import ToolExecutor
 from baskit.ai.tool_service import ToolService
 
 
+def pytest_collection_modifyitems(items):
+    """Run all async tests on a single session-scoped event loop."""
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if pytest_asyncio.is_async_test(item):
+            item.add_marker(session_loop, append=False)
+
+
 @pytest.fixture(scope="session")
 def engine():
     """Create a test database engine."""
-    # Enable SQLite foreign keys
-    def _fk_pragma_on_connect(dbapi_con, con_record):
+    # Enable SQLite foreign keys; durability is pointless for a throwaway DB
+    def _pragmas_on_connect(dbapi_con, con_record):
         if isinstance(dbapi_con, sqlite3.Connection):
-            dbapi_con.execute('PRAGMA foreign_keys=ON')
-
-    # Create in-memory database
+            dbapi_con.executescript(
+                'PRAGMA foreign_keys=ON;'
+                'PRAGMA synchronous=OFF;'
+                'PRAGMA journal_mode=MEMORY;'
+                'PRAGMA temp_store=MEMORY;'
+            )
+            # Let SQLAlchemy emit BEGIN itself, so SAVEPOINTs nest properly
+            dbapi_con.isolation_level = None
+
+    def _begin(conn):
+        conn.exec_driver_sql('BEGIN')
+
+    # Create in-memory database, kept on one connection for the whole session
     test_engine = create_engine(
-        "sqlite:///:memory:",
-        connect_args={
-            "detect_types": sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES,
-            "check_same_thread": False
-        }
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
     )
     
     # Enable foreign key support
-    event.listen(test_engine, 'connect', _fk_pragma_on_connect)
+    event.listen(test_engine, 'connect', _pragmas_on_connect)
+    event.listen(test_engine, 'begin', _begin)
     
-    return test_engine
+    yield test_engine
+    
+    # Closing the only connection discards the database and its tables
+    test_engine.dispose()
 
 
 @pytest.fixture(scope="session")
 def tables(engine):
     """Create all database tables."""
-    # Create tables
-    Base.metadata.create_all(engine)
-    yield
-    # Drop tables in correct order to avoid foreign key issues
-    inspector = inspect(engine)
-    # Get all table names
-    table_names = inspector.get_table_names()
-    # Drop tables in reverse order (children first)
-    for table in reversed(table_names):
-        Base.metadata.tables[table].drop(engine)
+    # Create tables; the in-memory database is always empty at this point
+    Base.metadata.create_all(engine, checkfirst=False)
+    # Configure mappers up front rather than inside whichever test runs first
+    configure_mappers()
 
 
-@pytest.fixture(scope="function")
-def session(engine, tables):
-    """Create a new database session for a test."""
+@contextmanager
+def _rolled_back_session(engine, **session_options) -> Iterator[Session]:
+    """Yield a session whose work is rolled back when the test ends."""
     connection = engine.connect()
     transaction = connection.begin()
-    session = Session(bind=connection)
-    
-    # Create tables
-    Base.metadata.create_all(connection)
+    # Commits inside the test only release a SAVEPOINT; the outer
+    # transaction is rolled back below, so tables are created just once
+    session = Session(
+        bind=connection,
+        join_transaction_mode="create_savepoint",
+        autoflush=False,
+        **session_options
+    )
     
     yield session
     
@@ -71,42 +90,76 @@ def session(engine, tables):
     connection.close()
 
 
+@pytest.fixture(scope="function")
+def session(engine, tables):
+    """Create a new database session for a test."""
+    # Test objects stay loaded after commit, saving a SELECT per fixture
+    with _rolled_back_session(engine, expire_on_commit=False) as session:
+        yield session
+
+
+@pytest.fixture(scope="function")
+def production_session(engine, tables):
+    """Create a session that expires on commit, like SessionLocal."""
+    # For code that caches or pickles ORM objects, where expiry matters
+    with _rolled_back_session(engine) as session:
+        yield session
+
+
+@pytest.fixture(scope="session")
+def user_id(engine, tables) -> int:
+    """Create the test user once, outside any per-test transaction."""
+    # Only the id is needed here, so skip the ORM unit of work
+    with engine.begin() as connection:
+        return connection.execute(
+            insert(User).returning(User.id)
+        ).scalar_one()
+
+
 @pytest.fixture
-def user(session) -> User:
-    """Create a test user."""
-    user = User()
-    session.add(user)
-    session.commit()
-    session.refresh(user)
-    return user
+def user(session, user_id) -> User:
+    """Load the test user into the test's session."""
+    return session.get(User, user_id)
 
 
 @pytest.fixture
-def list_service(session, user):
+def list_service(session, user_id):
     """Create a list service instance."""
-    return ListService(session, user.id)
+    return ListService(session, user_id)
 
 
 @pytest.fixture
-def item_service(session, user):
+def item_service(session, user_id):
     """Create an item service instance."""
-    return ItemService(session, user.id)
+    return ItemService(session, user_id)
 
 
 @pytest.fixture
-def grocery_list(session, user) -> GroceryList:
+def grocery_list(session, user_id) -> GroceryList:
     """Create a test grocery list."""
     list_ = GroceryList(
         name="רשימת קניות",
-        owner_id=user.id,
-        created_by=user.id,
+        owner_id=user_id,
+        created_by=user_id,
     )
     session.add(list_)
     session.commit()
-    session.refresh(list_)
     return list_
 
 
+@pytest.fixture
+def two_lists(session, user_id) -> List[GroceryList]:
+    """Create two test grocery lists in a single INSERT."""
+    lists = [
+        GroceryList(name=name, owner_id=user_id, created_by=user_id)
+        for name in ("רשימת קניות", "רשימת סופר")
+    ]
+    # One flush batches both rows into a single INSERT ... RETURNING
+    session.add_all(lists)
+    session.commit()
+    return lists
+
+
 @pytest.fixture
 def grocery_item(session, grocery_list) -> GroceryItem:
     """Create a test grocery item."""
@@ -120,152 +173,33 @@ def grocery_item(session, grocery_list) -> GroceryItem:
     )
     session.add(item)
     session.commit()
-    session.refresh(item)
     return item 
 
-@pytest.fixture
-def mock_openai():
-    """Create a mock OpenAI client."""
-    mock = Mock()
-    mock.chat.completions.create = AsyncMock()
-    return mock
-
-@pytest.fixture
-def mock_gpt_config():
-    """Create a test GPT configuration for mock mode."""
-    return GPTConfig(
-        model="mock",
-        temperature=0.0,  # Not used in mock mode
-        max_retries=1,    # Not used in mock mode
-        timeout=1         # Not used in mock mode
-    )
-
-@pytest.fixture
-def api_gpt_config():
-    """Create a test GPT configuration for API mode."""
-    return GPTConfig(
-        model="gpt-4",
-        temperature=0.0,  # Use zero temperature for deterministic results
-        max_retries=3,
-        timeout=10
-    )
-
-@pytest.fixture
-def gpt_context():
-    """Create a test GPT context."""
-    return GPTContext(
-        messages=[{
-            'role': 'system',
-            'content': 'אתה עוזר קניות בעברית.'
-        }],
-        current_list=None,
-        last_item=None
-    )
-
-@pytest.fixture
-def gpt_handler(mock_openai, mock_gpt_config):
-    """Create a test GPT handler in mock mode by default."""
-    handler = GPTHandler(mock_gpt_config)
-    handler.client = mock_openai
-    handler.use_mock = True  # Default to mock mode for safety
-    return handler
 
 @pytest.fixture
-def api_gpt_handler(mock_openai, api_gpt_config):
-    """Create a test GPT handler in API mode."""
-    handler = GPTHandler(api_gpt_config)
-    handler.client = mock_openai
-    handler.use_mock = False  # Explicitly use API mode
-    return handler
-
-@pytest.fixture
-def tool_executor(mock_item_service, mock_list_service):
-    """Create a test tool executor."""
-    return ToolExecutor(
-        item_service=mock_item_service,
-        list_service=mock_list_service
-    )
-
-@pytest.fixture
-def mock_item_service():
-    """Create a mock item service."""
-    mock = Mock()
-    mock.add_item = AsyncMock(return_value=Mock(success=True, data={'item': {
-        'id': 1,
-        'name': 'חלב',
-        'quantity': 1,
-        'unit': 'יחידה',
-        'is_bought': False
-    }}))
-    mock.update_item = AsyncMock(return_value=Mock(success=True))
-    mock.mark_bought = AsyncMock(return_value=Mock(success=True))
-    mock.get_item_locations = AsyncMock(return_value=Mock(success=True))
-    return mock
+def bulk_add_items(session, user_id):
+    """Insert (name, quantity, unit) items into a list in one statement, in order."""
+    def _add(list_id, items):
+        added = session.scalars(
+            insert(GroceryItem).returning(GroceryItem, sort_by_parameter_order=True),
+            [
+                {
+                    "name": name,
+                    "normalized_name": name.strip().lower(),
+                    "quantity": quantity,
+                    "unit": unit,
+                    "list_id": list_id,
+                    "created_by": user_id,
+                }
+                for name, quantity, unit in items
+            ]
+        ).all()
+        session.commit()
+        return added
+    return _add
 
-@pytest.fixture
-def mock_list_service():
-    """Create a mock list service."""
-    mock = Mock()
-    mock.create_list = AsyncMock(return_value=Mock(success=True))
-    mock.delete_list = AsyncMock(return_value=Mock(success=True))
-    mock.show_list = AsyncMock(return_value=Mock(success=True, data={
-        'list': {
-            'id': 1,
-            'name': 'רשימת קניות',
-            'items': [{
-                'id': 1,
-                'name': 'חלב',
-                'quantity': 1,
-                'unit': 'יחידה',
-                'is_bought': False
-            }]
-        }
-    }))
-    mock.get_lists = AsyncMock(return_value=Mock(success=True, data=[{
-        'id': 1,
-        'name': 'רשימת קניות'
-    }]))
-    return mock
 
 @pytest.fixture
-def tool_service(session, user):
+def tool_service(session, user_id):
     """Create a tool service instance."""
-    return ToolService(session, user.id)
-
-@pytest.fixture
-def hebrew_inputs():
-    """Create test Hebrew inputs and expected outputs."""
-    return [
-        (
-            'תוסיף חלב',
-            {
-                'name': 'add_item',
-                'arguments': {
-                    'name': 'חלב',
-                    'quantity': 1,
-                    'unit': 'יחידה'
-                }
-            }
-        ),
-        (
-            'תוריד 2 ביצים',
-            {
-                'name': 'update_quantity',
-                'arguments': {
-                    'name': 'ביצים',
-                    'quantity': 2,
-                    'operation': 'reduce'
-                }
-            }
-        ),
-        (
-            'סמן שקניתי חלב',
-            {
-                'name': 'mark_bought',
-                'arguments': {
-                    'name': 'חלב',
-                    'is_bought': True
-                }
-            }
-        )
-    ] 
\ No newline at end of file
+    return ToolService(session, user_id)
@@ -5,6 +5,10 @@ from datetime import datetime, UTC
 from baskit.models import User, GroceryList, GroceryItem
 
 
+# Timestamp for tests that only need some timezone-aware moment
+FROZEN_NOW = datetime.now(UTC)
+
+
 def test_user_creation(user):
     """Test that a user can be created."""
     assert user.id is not None
@@ -51,7 +55,7 @@ def test_list_soft_delete(session, grocery_list, user):
     """Test that a list can be soft-deleted."""
     # Soft delete the list
     grocery_list.is_deleted = True
-    grocery_list.deleted_at = datetime.now(UTC)
+    grocery_list.deleted_at = FROZEN_NOW
     grocery_list.deleted_by = user.id
     session.commit()
     
@@ -2,108 +2,124 @@
 import pytest
 from datetime import datetime, UTC
 
-from baskit.services.item_service import ItemService, ItemLocation
+from baskit.services.item_service import ItemLocation
 from baskit.models import GroceryItem
 
+# Fragments of the service's Hebrew error messages
+ERR_EMPTY_TEXT = "טקסט לא יכול להיות ריק"
+ERR_NOT_HEBREW = "טקסט חייב להיות בעיקר בעברית"
+ERR_NOT_POSITIVE = "חיובית"
+ERR_QUANTITY_TOO_HIGH = "99"
+ERR_LIST_NOT_FOUND = "רשימה לא נמצאה"
+ERR_ITEM_NOT_FOUND = "פריט לא נמצא"
+ERR_ADD_TO_DELETED_LIST = "לא ניתן להוסיף פריטים לרשימה מחוקה"
+ERR_UPDATE_IN_DELETED_LIST = "לא ניתן לעדכן פריטים ברשימה מחוקה"
+ERR_REMOVE_FROM_DELETED_LIST = "לא ניתן למחוק פריטים מרשימה מחוקה"
+
+# One character over the item name length limit
+LONG_NAME = "א" * 101
+
+INVALID_QUANTITIES = [
+    pytest.param(-1, ERR_NOT_POSITIVE, id="negative"),
+    pytest.param(0, ERR_NOT_POSITIVE, id="zero"),
+    pytest.param(100, ERR_QUANTITY_TOO_HIGH, id="toolarge"),
+]
+
+
+@pytest.fixture
+def shopping_list_id(grocery_list):
+    """ID of a fresh list for tests that only need somewhere to add items."""
+    # Per-test like the session it lives in, so rejected writes can't leak
+    return grocery_list.id
+
 
 @pytest.fixture
-def item_service(session, user):
-    """Create an item service instance."""
-    return ItemService(session, user.id)
+def list_with_item(item_service, shopping_list_id, request):
+    """Add milk to the test list; quantity comes from indirect param (default 1)."""
+    quantity = getattr(request, "param", 1)
+    add_result = item_service.add_item(shopping_list_id, "חלב", quantity, "ליטר")
+    assert add_result.success, add_result.error
+    return shopping_list_id, add_result.data.id
 
 
-def test_add_item(list_service, item_service):
+@pytest.fixture
+def deleted_list_with_item(list_service, list_with_item):
+    """Soft-delete the list_with_item list, keeping its item."""
+    list_id, _ = list_with_item
+    delete_result = list_service.delete_list(list_id)
+    assert delete_result.success, delete_result.error
+    return list_with_item
+
+
+def test_add_item(item_service, shopping_list_id):
     """Test adding an item to a list."""
-    # Create list
-    list_result = list_service.create_list("רשימת קניות")
-    assert list_result.success
-    list_id = list_result.data.id
-    
     # Add item
-    result = item_service.add_item(list_id, "חלב", 2, "ליטר")
+    result = item_service.add_item(shopping_list_id, "חלב", 2, "ליטר")
     assert result.success
     assert result.data.name == "חלב"
     assert result.data.quantity == 2
     assert result.data.unit == "ליטר"
-    assert result.data.list_id == list_id
+    assert result.data.list_id == shopping_list_id
     assert result.data.created_by == item_service.user_id
     assert not result.data.is_bought
 
 
-def test_add_item_invalid_name(list_service, item_service):
+@pytest.mark.parametrize("name,err_fragment", [
+    pytest.param("", ERR_EMPTY_TEXT, id="empty"),
+    pytest.param("Milk", ERR_NOT_HEBREW, id="nonhebrew"),
+])
+def test_add_item_invalid_name(item_service, shopping_list_id, name, err_fragment):
     """Test adding an item with invalid name."""
-    # Create list
-    list_result = list_service.create_list("רשימת קניות")
-    assert list_result.success
-    list_id = list_result.data.id
-    
-    # Empty name
-    result = item_service.add_item(list_id, "")
-    assert not result.success
-    assert "טקסט לא יכול להיות ריק" in result.error
-    
-    # Non-Hebrew name
-    result = item_service.add_item(list_id, "Milk")
+    result = item_service.add_item(shopping_list_id, name)
     assert not result.success
-    assert "טקסט חייב להיות בעיקר בעברית" in result.error
+    assert err_fragment in result.error
 
 
-def test_add_item_invalid_quantity(list_service, item_service):
+@pytest.mark.parametrize("qty,err_fragment", INVALID_QUANTITIES)
+def test_add_item_invalid_quantity(item_service, shopping_list_id, qty, err_fragment):
     """Test adding an item with invalid quantity."""
-    # Create list
-    list_result = list_service.create_list("רשימת קניות")
-    assert list_result.success
-    list_id = list_result.data.id
-    
-    # Negative quantity
-    result = item_service.add_item(list_id, "חלב", -1)
-    assert not result.success
-    assert "חיובית" in result.error
-    
-    # Zero quantity
-    result = item_service.add_item(list_id, "חלב", 0)
+    result = item_service.add_item(shopping_list_id, "חלב", qty)
     assert not result.success
-    assert "חיובית" in result.error
-    
-    # Too large quantity
-    result = item_service.add_item(list_id, "חלב", 100)
-    assert not result.success
-    assert "99" in result.error
+    assert err_fragment in result.error
 
 
 def test_add_item_to_nonexistent_list(item_service):
     """Test adding an item to a non-existent list."""
     result = item_service.add_item(999, "חלב")
     assert not result.success
-    assert "רשימה לא נמצאה" in result.error
-
-
-def test_add_item_to_deleted_list(list_service, item_service):
-    """Test adding an item to a deleted list."""
-    # Create and delete list
-    list_result = list_service.create_list("רשימת קניות")
-    assert list_result.success
-    list_id = list_result.data.id
-    
-    delete_result = list_service.delete_list(list_id)
-    assert delete_result.success
-    
-    # Try to add item
-    result = item_service.add_item(list_id, "חלב")
+    assert ERR_LIST_NOT_FOUND in result.error
+
+
+@pytest.mark.parametrize("operation,err_fragment", [
+    pytest.param(
+        lambda service, list_id, item_id: service.add_item(list_id, "חלב"),
+        ERR_ADD_TO_DELETED_LIST,
+        id="add"
+    ),
+    pytest.param(
+        lambda service, list_id, item_id: service.mark_bought(item_id),
+        ERR_UPDATE_IN_DELETED_LIST,
+        id="mark_bought"
+    ),
+    pytest.param(
+        lambda service, list_id, item_id: service.remove_item(item_id),
+        ERR_REMOVE_FROM_DELETED_LIST,
+        id="remove"
+    ),
+])
+def test_item_operation_on_deleted_list(
+    item_service, deleted_list_with_item, operation, err_fragment
+):
+    """Test that item operations on a deleted list are rejected."""
+    list_id, item_id = deleted_list_with_item
+    result = operation(item_service, list_id, item_id)
     assert not result.success
-    assert "לא ניתן להוסיף פריטים לרשימה מחוקה" in result.error
+    assert err_fragment in result.error
 
 
-def test_mark_bought(list_service, item_service):
+def test_mark_bought(item_service, list_with_item):
     """Test marking an item as bought."""
-    # Create list and add item
-    list_result = list_service.create_list("רשימת קניות")
-    assert list_result.success
-    list_id = list_result.data.id
-    
-    add_result = item_service.add_item(list_id, "חלב")
-    assert add_result.success
-    item_id = add_result.data.id
+    _, item_id = list_with_item
     
     # Mark as bought
     result = item_service.mark_bought(item_id)
@@ -123,89 +139,32 @@ def test_mark_bought_nonexistent_item(item_service):
     """Test marking a non-existent item as bought."""
     result = item_service.mark_bought(999)
     assert not result.success
-    assert "פריט לא נמצא" in result.error
-
-
-def test_mark_bought_in_deleted_list(list_service, item_service):
-    """Test marking an item as bought in a deleted list."""
-    # Create list and add item
-    list_result = list_service.create_list("רשימת קניות")
-    assert list_result.success
-    list_id = list_result.data.id
-    
-    add_result = item_service.add_item(list_id, "חלב")
-    assert add_result.success
-    item_id = add_result.data.id
-    
-    # Delete list
-    delete_result = list_service.delete_list(list_id)
-    assert delete_result.success
-    
-    # Try to mark item as bought
-    result = item_service.mark_bought(item_id)
-    assert not result.success
-    assert "לא ניתן לעדכן פריטים ברשימה מחוקה" in result.error
+    assert ERR_ITEM_NOT_FOUND in result.error
 
 
-def test_remove_item(list_service, item_service):
+def test_remove_item(session, item_service, list_with_item):
     """Test removing an item."""
-    # Create list and add item
-    list_result = list_service.create_list("רשימת קניות")
-    assert list_result.success
-    list_id = list_result.data.id
-    
-    add_result = item_service.add_item(list_id, "חלב")
-    assert add_result.success
-    item_id = add_result.data.id
+    _, item_id = list_with_item
     
     # Remove item
     result = item_service.remove_item(item_id)
     assert result.success
     
     # Verify item is gone
-    with item_service.transaction.transaction() as session:
-        item = session.get(GroceryItem, item_id)
-        assert item is None
+    session.expire_all()
+    assert session.get(GroceryItem, item_id) is None
 
 
 def test_remove_nonexistent_item(item_service):
     """Test removing a non-existent item."""
     result = item_service.remove_item(999)
     assert not result.success
-    assert "פריט לא נמצא" in result.error
+    assert ERR_ITEM_NOT_FOUND in result.error
 
 
-def test_remove_item_from_deleted_list(list_service, item_service):
-    """Test removing an item from a deleted list."""
-    # Create list and add item
-    list_result = list_service.create_list("רשימת קניות")
-    assert list_result.success
-    list_id = list_result.data.id
-    
-    add_result = item_service.add_item(list_id, "חלב")
-    assert add_result.success
-    item_id = add_result.data.id
-    
-    # Delete list
-    delete_result = list_service.delete_list(list_id)
-    assert delete_result.success
-    
-    # Try to remove item
-    result = item_service.remove_item(item_id)
-    assert not result.success
-    assert "לא ניתן למחוק פריטים מרשימה מחוקה" in result.error 
-
-
-def test_update_item(list_service, item_service):
+def test_update_item(item_service, list_with_item):
     """Test updating an item's quantity and unit."""
-    # Create list and add item
-    list_result = list_service.create_list("רשימת קניות")
-    assert list_result.success
-    list_id = list_result.data.id
-    
-    add_result = item_service.add_item(list_id, "חלב", 1, "ליטר")
-    assert add_result.success
-    item_id = add_result.data.id
+    _, item_id = list_with_item
     
     # Update quantity only
     result = item_service.update_item(item_id, quantity=2)
@@ -226,104 +185,41 @@ def test_update_item(list_service, item_service):
     assert result.data.unit == "בקבוק"
 
 
-def test_update_item_invalid_quantity(list_service, item_service):
+@pytest.mark.parametrize("qty,err_fragment", INVALID_QUANTITIES)
+def test_update_item_invalid_quantity(item_service, list_with_item, qty, err_fragment):
     """Test updating an item with invalid quantity."""
-    # Create list and add item
-    list_result = list_service.create_list("רשימת קניות")
-    assert list_result.success
-    list_id = list_result.data.id
-    
-    add_result = item_service.add_item(list_id, "חלב")
-    assert add_result.success
-    item_id = add_result.data.id
+    _, item_id = list_with_item
     
-    # Negative quantity
-    result = item_service.update_item(item_id, quantity=-1)
+    result = item_service.update_item(item_id, quantity=qty)
     assert not result.success
-    assert "חיובית" in result.error
-    
-    # Zero quantity
-    result = item_service.update_item(item_id, quantity=0)
-    assert not result.success
-    assert "חיובית" in result.error
-    
-    # Too large quantity
-    result = item_service.update_item(item_id, quantity=100)
-    assert not result.success
-    assert "99" in result.error
-
-
-def test_increment_quantity(list_service, item_service):
-    """Test incrementing an item's quantity."""
-    # Create list and add item
-    list_result = list_service.create_list("רשימת קניות")
-    assert list_result.success
-    list_id = list_result.data.id
-    
-    add_result = item_service.add_item(list_id, "חלב", 1)
-    assert add_result.success
-    item_id = add_result.data.id
-    
-    # Increment by default (1)
-    result = item_service.increment_quantity(item_id)
-    assert result.success
-    assert result.data.quantity == 2
-    
-    # Increment by specific amount
-    result = item_service.increment_quantity(item_id, step=3)
-    assert result.success
-    assert result.data.quantity == 5
-
-
-def test_increment_quantity_exceeds_max(list_service, item_service):
-    """Test incrementing quantity beyond maximum."""
-    # Create list and add item
-    list_result = list_service.create_list("רשימת קניות")
-    assert list_result.success
-    list_id = list_result.data.id
-    
-    add_result = item_service.add_item(list_id, "חלב", 98)
-    assert add_result.success
-    item_id = add_result.data.id
-    
-    # Try to increment beyond max
-    result = item_service.increment_quantity(item_id, step=2)
-    assert not result.success
-    assert "99" in result.error
-
-
-def test_reduce_quantity(list_service, item_service):
-    """Test reducing an item's quantity."""
-    # Create list and add item
-    list_result = list_service.create_list("רשימת קניות")
-    assert list_result.success
-    list_id = list_result.data.id
-    
-    add_result = item_service.add_item(list_id, "חלב", 5)
-    assert add_result.success
-    item_id = add_result.data.id
-    
-    # Reduce by default (1)
-    result = item_service.reduce_quantity(item_id)
-    assert result.success
-    assert result.data.quantity == 4
-    
-    # Reduce by specific amount
-    result = item_service.reduce_quantity(item_id, step=2)
-    assert result.success
-    assert result.data.quantity == 2
-
-
-def test_reduce_quantity_to_zero(list_service, item_service):
+    assert err_fragment in result.error
+
+
+@pytest.mark.parametrize("list_with_item,method,step,expected", [
+    pytest.param(1, "increment_quantity", None, 2, id="inc_default"),
+    pytest.param(2, "increment_quantity", 3, 5, id="inc_3"),
+    pytest.param(98, "increment_quantity", 2, ERR_QUANTITY_TOO_HIGH, id="inc_overflow"),
+    pytest.param(5, "reduce_quantity", None, 4, id="dec_default"),
+    pytest.param(4, "reduce_quantity", 2, 2, id="dec_2"),
+], indirect=["list_with_item"])
+def test_quantity_step(item_service, list_with_item, method, step, expected):
+    """Test stepping an item's quantity up or down."""
+    _, item_id = list_with_item
+    step_kwargs = {} if step is None else {"step": step}
+    
+    result = getattr(item_service, method)(item_id, **step_kwargs)
+    if isinstance(expected, int):
+        assert result.success
+        assert result.data.quantity == expected
+    else:
+        assert not result.success
+        assert expected in result.error
+
+
+@pytest.mark.parametrize("list_with_item", [2], indirect=True)
+def test_reduce_quantity_to_zero(session, item_service, list_with_item):
     """Test reducing quantity to zero removes the item."""
-    # Create list and add item
-    list_result = list_service.create_list("רשימת קניות")
-    assert list_result.success
-    list_id = list_result.data.id
-    
-    add_result = item_service.add_item(list_id, "חלב", 2)
-    assert add_result.success
-    item_id = add_result.data.id
+    _, item_id = list_with_item
     
     # Reduce to zero
     result = item_service.reduce_quantity(item_id, step=2)
@@ -331,36 +227,27 @@ def test_reduce_quantity_to_zero(list_service, item_service):
     assert "הוסר" in result.message
     
     # Verify item is gone
-    with item_service.transaction.transaction() as session:
-        item = session.get(GroceryItem, item_id)
-        assert item is None
+    session.expire_all()
+    assert session.get(GroceryItem, item_id) is None
 
 
-def test_get_item_locations(list_service, item_service):
+def test_get_item_locations(item_service, two_lists):
     """Test finding item locations across lists."""
-    # Create two lists
-    list1_result = list_service.create_list("רשימת קניות 1")
-    assert list1_result.success
-    list1_id = list1_result.data.id
-    
-    list2_result = list_service.create_list("רשימת קניות 2")
-    assert list2_result.success
-    list2_id = list2_result.data.id
+    list1_id, list2_id = (list_.id for list_ in two_lists)
     
     # Add same item to both lists
-    item1_result = item_service.add_item(list1_id, "חלב", 1, "ליטר")
-    assert item1_result.success
-    
-    item2_result = item_service.add_item(list2_id, "חלב", 2, "קרטון")
-    assert item2_result.success
+    r = item_service.add_item(list1_id, "חלב", 1, "ליטר")
+    assert r.success, r.error
+    r = item_service.add_item(list2_id, "חלב", 2, "קרטון")
+    assert r.success, r.error
     
     # Find locations
     result = item_service.get_item_locations("חלב")
     assert result.success
     assert len(result.data) == 2
     
-    # Verify locations
-    locations = sorted(result.data, key=lambda x: x.list_id)
+    # Verify locations, which come back ordered by list
+    locations = result.data
     assert locations[0].list_id == list1_id
     assert locations[0].quantity == 1
     assert locations[0].unit == "ליטר"
@@ -370,24 +257,18 @@ def test_get_item_locations(list_service, item_service):
     assert locations[1].unit == "קרטון"
 
 
-def test_get_item_locations_with_bought(list_service, item_service):
+def test_get_item_locations_with_bought(item_service, list_with_item):
     """Test finding item locations including bought items."""
-    # Create list and add items
-    list_result = list_service.create_list("רשימת קניות")
-    assert list_result.success
-    list_id = list_result.data.id
+    shopping_list_id, item1_id = list_with_item
     
-    item1_result = item_service.add_item(list_id, "חלב", 1)
-    assert item1_result.success
-    item1_id = item1_result.data.id
-    
-    item2_result = item_service.add_item(list_id, "חלב", 2)
-    assert item2_result.success
-    item2_id = item2_result.data.id
+    # Add a second item
+    r = item_service.add_item(shopping_list_id, "חלב", 2)
+    assert r.success, r.error
+    item2_id = r.data.id
     
     # Mark one as bought
-    mark_result = item_service.mark_bought(item1_id)
-    assert mark_result.success
+    r = item_service.mark_bought(item1_id)
+    assert r.success, r.error
     
     # Find locations (excluding bought)
     result = item_service.get_item_locations("חלב")
@@ -401,30 +282,19 @@ def test_get_item_locations_with_bought(list_service, item_service):
     assert len(result.data) == 2
 
 
-def test_validate_item_name(item_service):
+@pytest.mark.parametrize("name,ok,expected", [
+    ("חלב", True, "חלב"),
+    ("  חלב  ", True, "חלב"),
+    ("", False, "ריק"),
+    ("א", False, "2 תווים"),
+    ("milk", False, "עברית"),
+    (LONG_NAME, False, "100 תווים"),
+], ids=["valid", "trimmed", "empty", "tooshort", "nonhebrew", "toolong"])
+def test_validate_item_name(item_service, name, ok, expected):
     """Test item name validation."""
-    # Valid names
-    result = item_service.validate_item_name("חלב")
-    assert result.success
-    assert result.data == "חלב"
-    
-    result = item_service.validate_item_name("  חלב  ")
-    assert result.success
-    assert result.data == "חלב"
-    
-    # Invalid names
-    result = item_service.validate_item_name("")
-    assert not result.success
-    assert "ריק" in result.error
-    
-    result = item_service.validate_item_name("א")
-    assert not result.success
-    assert "2 תווים" in result.error
-    
-    result = item_service.validate_item_name("milk")
-    assert not result.success
-    assert "עברית" in result.error
-    
-    result = item_service.validate_item_name("א" * 101)
-    assert not result.success
-    assert "100 תווים" in result.error 
\ No newline at end of file
+    result = item_service.validate_item_name(name)
+    assert result.success is ok
+    if ok:
+        assert result.data == expected
+    else:
+        assert expected in result.error
@@ -2,17 +2,47 @@
 import pytest
 from datetime import datetime, UTC
 
-from baskit.services.list_service import ListService, ListContents, ListSummary
+from baskit.services.list_service import ListContents, ListService, ListSummary
+from baskit.services.item_service import ItemService
 from baskit.models import GroceryList, GroceryItem
 
+# Fragments of the service's Hebrew error messages
+ERR_EMPTY_NAME = "שם לא יכול להיות ריק"
+ERR_NOT_HEBREW = "טקסט חייב להיות בעיקר בעברית"
+ERR_ALREADY_EXISTS = "כבר קיים"
+ERR_ACTIVE_LIST_EXISTS = "קיימת רשימה פעילה"
+ERR_LIST_NOT_FOUND = "רשימה לא נמצאה"
+ERR_LIST_DELETED = "נמחקה"
+ERR_NO_DEFAULT_LIST = "לא נמצאה רשימה ברירת מחדל"
+ERR_NO_LISTS = "לא נמצאו רשימות"
+
+# Suggestions offered when there is no list, or only a deleted one
+SUGGEST_CREATE_LIST = "צור רשימה חדשה"
+SUGGEST_RESTORE_LIST = "שחזר את הרשימה"
+
+# List names every name check rejects: (name, error fragment)
+INVALID_NAMES = (
+    ("", ERR_EMPTY_NAME),
+    ("Shopping List", ERR_NOT_HEBREW),
+)
+
+# Test ids for INVALID_NAMES, in the same order
+INVALID_NAME_IDS = ("empty", "nonhebrew")
+
+
+def _unwrap(result):
+    """Return a setup step's data, failing with its error if it failed."""
+    assert result.success, result.error
+    return result.data
+
 
 @pytest.fixture
-def list_service(session, user):
-    """Create a list service instance."""
-    return ListService(session, user.id)
+def list_id(list_service) -> int:
+    """Create a list through the service, so it becomes the default list."""
+    return _unwrap(list_service.create_list("רשימת קניות")).id
 
 
-def test_create_list(list_service):
+def test_create_list(list_service, user):
     """Test creating a new list."""
     # Create list
     result = list_service.create_list("רשימת קניות")
@@ -21,45 +51,32 @@ def test_create_list(list_service):
     assert result.data.owner_id == list_service.user_id
     assert not result.data.is_deleted
     
-    # Should be default list (first list)
-    default_result = list_service.get_default_list()
-    assert default_result.success
-    assert default_result.data.id == result.data.id
+    # Should be default list (first list); the service updated the loaded user
+    assert user.default_list_id == result.data.id
 
 
-def test_create_list_invalid_name(list_service):
+@pytest.mark.parametrize("name,err_fragment", INVALID_NAMES, ids=INVALID_NAME_IDS)
+def test_create_list_invalid_name(list_service, name, err_fragment):
     """Test creating a list with invalid name."""
-    # Empty name
-    result = list_service.create_list("")
-    assert not result.success
-    assert "שם לא יכול להיות ריק" in result.error
-    
-    # Non-Hebrew name
-    result = list_service.create_list("Shopping List")
+    result = list_service.create_list(name)
     assert not result.success
-    assert "טקסט חייב להיות בעיקר בעברית" in result.error
+    assert err_fragment in result.error
 
 
 def test_create_duplicate_list(list_service):
     """Test creating a list with duplicate name."""
     # Create first list
-    result1 = list_service.create_list("רשימת קניות")
-    assert result1.success
+    _unwrap(list_service.create_list("רשימת קניות"))
     
     # Try to create second list with same name
     result2 = list_service.create_list("רשימת קניות")
     assert not result2.success
-    assert "כבר קיים" in result2.error
+    assert ERR_ALREADY_EXISTS in result2.error
     assert len(result2.suggestions) > 0
 
 
-def test_delete_list(list_service):
+def test_delete_list(list_service, list_id, user):
     """Test deleting a list."""
-    # Create list
-    create_result = list_service.create_list("רשימת קניות")
-    assert create_result.success
-    list_id = create_result.data.id
-    
     # Soft delete
     delete_result = list_service.delete_list(list_id)
     assert delete_result.success
@@ -68,20 +85,13 @@ def test_delete_list(list_service):
     assert delete_result.data.deleted_by == list_service.user_id
     
     # Should not be default list anymore
-    default_result = list_service.get_default_list()
-    assert default_result.success
-    assert default_result.data is None
+    assert user.default_list_id is None
 
 
-def test_restore_list(list_service):
+def test_restore_list(list_service, list_id):
     """Test restoring a deleted list."""
-    # Create and delete list
-    list_result = list_service.create_list("רשימת קניות")
-    assert list_result.success
-    list_id = list_result.data.id
-    
-    delete_result = list_service.delete_list(list_id)
-    assert delete_result.success
+    # Delete list
+    _unwrap(list_service.delete_list(list_id))
     
     # Restore list
     restore_result = list_service.restore_list(list_id)
@@ -91,39 +101,23 @@ def test_restore_list(list_service):
     assert restore_result.data.deleted_by is None
 
 
-def test_restore_list_with_conflict(list_service):
+def test_restore_list_with_conflict(list_service, two_lists):
     """Test restoring a list when active list exists with same name."""
-    # Create first list
-    list1_result = list_service.create_list("רשימת קניות")
-    assert list1_result.success
-    list1_id = list1_result.data.id
+    list1, list2 = two_lists
     
-    # Create second list with different name
-    list2_result = list_service.create_list("רשימת סופר")
-    assert list2_result.success
-    
-    # Delete first list
-    delete_result = list_service.delete_list(list1_id)
-    assert delete_result.success
-    
-    # Rename second list to first list's name
-    rename_result = list_service.rename_list(list2_result.data.id, "רשימת קניות")
-    assert rename_result.success
+    # Delete first list, then give the second one its name
+    _unwrap(list_service.delete_list(list1.id))
+    _unwrap(list_service.rename_list(list2.id, "רשימת קניות"))
     
     # Try to restore first list
-    restore_result = list_service.restore_list(list1_id)
+    restore_result = list_service.restore_list(list1.id)
     assert not restore_result.success
-    assert "קיימת רשימה פעילה" in restore_result.error
+    assert ERR_ACTIVE_LIST_EXISTS in restore_result.error
     assert len(restore_result.suggestions) > 0
 
 
-def test_rename_list(list_service):
+def test_rename_list(list_service, list_id):
     """Test renaming a list."""
-    # Create list
-    list_result = list_service.create_list("רשימת קניות")
-    assert list_result.success
-    list_id = list_result.data.id
-    
     # Rename list
     rename_result = list_service.rename_list(list_id, "רשימת סופר")
     assert rename_result.success
@@ -131,22 +125,18 @@ def test_rename_list(list_service):
     assert rename_result.data.updated_by == list_service.user_id
 
 
-def test_rename_list_invalid_name(list_service):
+@pytest.mark.parametrize("name,err_fragment", INVALID_NAMES, ids=INVALID_NAME_IDS)
+def test_rename_list_invalid_name(list_service, grocery_list, name, err_fragment):
     """Test renaming a list with invalid name."""
-    # Create list
-    list_result = list_service.create_list("רשימת קניות")
-    assert list_result.success
-    list_id = list_result.data.id
-    
-    # Try to rename with empty name
-    rename_result = list_service.rename_list(list_id, "")
+    rename_result = list_service.rename_list(grocery_list.id, name)
     assert not rename_result.success
-    assert "שם לא יכול להיות ריק" in rename_result.error
-    
-    # Try to rename with non-Hebrew name
-    rename_result = list_service.rename_list(list_id, "Shopping List")
-    assert not rename_result.success
-    assert "טקסט חייב להיות בעיקר בעברית" in rename_result.error
+    assert err_fragment in rename_result.error
+
+
+def test_rename_list_invalid_name_keeps_name(list_service, grocery_list):
+    """Test that a rejected rename leaves the original name."""
+    for name, _ in INVALID_NAMES:
+        assert not list_service.rename_list(grocery_list.id, name).success
     
     # Original name should not change
     list_result = list_service.get_lists()
@@ -154,86 +144,42 @@ def test_rename_list_invalid_name(list_service):
     assert list_result.data[0].name == "רשימת קניות"
 
 
-def test_rename_list_to_existing_name(list_service):
+def test_rename_list_to_existing_name(list_service, two_lists):
     """Test renaming a list to an existing name."""
-    # Create two lists
-    list1_result = list_service.create_list("רשימת קניות")
-    assert list1_result.success
-    
-    list2_result = list_service.create_list("רשימת סופר")
-    assert list2_result.success
+    _, list2 = two_lists
     
     # Try to rename second list to first list's name
-    rename_result = list_service.rename_list(list2_result.data.id, "רשימת קניות")
+    rename_result = list_service.rename_list(list2.id, "רשימת קניות")
     assert not rename_result.success
-    assert "כבר קיים" in rename_result.error
+    assert ERR_ALREADY_EXISTS in rename_result.error
     assert len(rename_result.suggestions) > 0
 
 
-def test_set_default_list(list_service):
+def test_set_default_list(list_service, two_lists, user):
     """Test setting default list."""
-    # Create two lists
-    list1_result = list_service.create_list("רשימת קניות")
-    assert list1_result.success
-    list1_id = list1_result.data.id
-    
-    list2_result = list_service.create_list("רשימת סופר")
-    assert list2_result.success
-    list2_id = list2_result.data.id
-    
-    # First list should be default
-    default_result = list_service.get_default_list()
-    assert default_result.success
-    assert default_result.data.id == list1_id
+    list1, list2 = two_lists
     
     # Set second list as default
-    set_default_result = list_service.set_default_list(list2_id)
+    set_default_result = list_service.set_default_list(list2.id)
     assert set_default_result.success
+    assert set_default_result.data.id == list2.id
+    assert user.default_list_id == list2.id
     
     # Verify second list is now default
     default_result = list_service.get_default_list()
     assert default_result.success
-    assert default_result.data.id == list2_id
-
-
-def test_get_lists(list_service):
-    """Test getting all lists."""
-    # Create two lists
-    list1_result = list_service.create_list("רשימת קניות")
-    assert list1_result.success
+    assert default_result.data.id == list2.id
     
-    list2_result = list_service.create_list("רשימת סופר")
-    assert list2_result.success
-    
-    # Delete second list
-    delete_result = list_service.delete_list(list2_result.data.id)
-    assert delete_result.success
-    
-    # Get active lists
-    lists_result = list_service.get_lists()
-    assert lists_result.success
-    assert len(lists_result.data) == 1
-    assert lists_result.data[0].id == list1_result.data.id
-    
-    # Get all lists including deleted
-    all_lists_result = list_service.get_lists(include_deleted=True)
-    assert all_lists_result.success
-    assert len(all_lists_result.data) == 2 
+    # Move the default back to the first list
+    set_default_result = list_service.set_default_list(list1.id)
+    assert set_default_result.success
+    assert user.default_list_id == list1.id
 
 
-def test_show_list(list_service, item_service):
+def test_show_list(list_service, list_id, bulk_add_items):
     """Test showing list contents."""
-    # Create list with items
-    list_result = list_service.create_list("רשימת קניות")
-    assert list_result.success
-    list_id = list_result.data.id
-    
     # Add items
-    item1_result = item_service.add_item(list_id, "חלב", 1, "ליטר")
-    assert item1_result.success
-    
-    item2_result = item_service.add_item(list_id, "לחם", 2, "יחידה")
-    assert item2_result.success
+    bulk_add_items(list_id, [("חלב", 1, "ליטר"), ("לחם", 2, "יחידה")])
     
     # Show list
     result = list_service.show_list(list_id)
@@ -245,24 +191,13 @@ def test_show_list(list_service, item_service):
     assert result.data.is_default  # First list is default
 
 
-def test_show_list_with_bought_items(list_service, item_service):
+def test_show_list_with_bought_items(list_service, list_id, item_service, bulk_add_items):
     """Test showing list contents with bought items filter."""
-    # Create list with items
-    list_result = list_service.create_list("רשימת קניות")
-    assert list_result.success
-    list_id = list_result.data.id
-    
     # Add items
-    item1_result = item_service.add_item(list_id, "חלב", 1)
-    assert item1_result.success
-    item1_id = item1_result.data.id
-    
-    item2_result = item_service.add_item(list_id, "לחם", 2)
-    assert item2_result.success
+    item1, _ = bulk_add_items(list_id, [("חלב", 1, "יחידה"), ("לחם", 2, "יחידה")])
     
     # Mark first item as bought
-    mark_result = item_service.mark_bought(item1_id)
-    assert mark_result.success
+    _unwrap(item_service.mark_bought(item1.id))
     
     # Show list with bought items
     result = list_service.show_list(list_id, include_bought=True)
@@ -276,80 +211,57 @@ def test_show_list_with_bought_items(list_service, item_service):
     assert result.data.items[0].name == "לחם"
 
 
-def test_show_default_list(list_service):
+def test_show_default_list(list_service, list_id):
     """Test showing default list when no list_id provided."""
-    # Create list
-    list_result = list_service.create_list("רשימת קניות")
-    assert list_result.success
-    
     # Show default list
     result = list_service.show_list()
     assert result.success
-    assert result.data.id == list_result.data.id
+    assert result.data.id == list_id
     assert result.data.is_default
 
 
-def test_show_list_errors(list_service):
+def _deleted_list_id(list_service) -> int:
+    """Create and soft-delete a list, returning its ID."""
+    list_id = _unwrap(list_service.create_list("רשימת קניות")).id
+    _unwrap(list_service.delete_list(list_id))
+    return list_id
+
+
+@pytest.mark.parametrize("make_target,err_fragment,suggestion", [
+    pytest.param(lambda service: None, ERR_NO_DEFAULT_LIST, SUGGEST_CREATE_LIST, id="no_default"),
+    pytest.param(lambda service: 999, ERR_LIST_NOT_FOUND, None, id="missing_id"),
+    pytest.param(_deleted_list_id, ERR_LIST_DELETED, SUGGEST_RESTORE_LIST, id="soft_deleted"),
+])
+def test_show_list_errors(list_service, make_target, err_fragment, suggestion):
     """Test error cases for show_list."""
-    # No default list
-    result = list_service.show_list()
-    assert not result.success
-    assert "לא נמצאה רשימה ברירת מחדל" in result.error
-    assert "צור רשימה חדשה" in result.suggestions
-    
-    # Non-existent list
-    result = list_service.show_list(999)
-    assert not result.success
-    assert "רשימה לא נמצאה" in result.error
-    
-    # Deleted list
-    list_result = list_service.create_list("רשימת קניות")
-    assert list_result.success
-    list_id = list_result.data.id
-    
-    delete_result = list_service.delete_list(list_id)
-    assert delete_result.success
-    
-    result = list_service.show_list(list_id)
+    result = list_service.show_list(make_target(list_service))
     assert not result.success
-    assert "נמחקה" in result.error
-    assert len(result.suggestions) > 0
+    assert err_fragment in result.error
+    if suggestion:
+        assert suggestion in result.suggestions
 
 
-def test_list_all_user_lists(list_service, item_service):
+def test_list_all_user_lists(list_service, item_service, bulk_add_items):
     """Test listing all user lists with summaries."""
     # Create lists with items
-    list1_result = list_service.create_list("רשימת קניות")
-    assert list1_result.success
-    list1_id = list1_result.data.id
-    
-    list2_result = list_service.create_list("רשימת סופר")
-    assert list2_result.success
-    list2_id = list2_result.data.id
-    
-    # Add items to first list
-    item1_result = item_service.add_item(list1_id, "חלב")
-    assert item1_result.success
-    item1_id = item1_result.data.id
+    list1_id = _unwrap(list_service.create_list("רשימת קניות")).id
+    list2_id = _unwrap(list_service.create_list("רשימת סופר")).id
     
-    item2_result = item_service.add_item(list1_id, "לחם")
-    assert item2_result.success
+    # Add items to both lists
+    item1, _ = bulk_add_items(list1_id, [("חלב", 1, "יחידה"), ("לחם", 1, "יחידה")])
+    bulk_add_items(list2_id, [("ביצים", 1, "יחידה")])
     
     # Mark one item as bought
-    mark_result = item_service.mark_bought(item1_id)
-    assert mark_result.success
-    
-    # Add item to second list
-    item3_result = item_service.add_item(list2_id, "ביצים")
-    assert item3_result.success
+    _unwrap(item_service.mark_bought(item1.id))
     
     # List all lists
     result = list_service.list_all_user_lists()
     assert result.success
-    assert len(result.data) == 2
+    summaries = {summary.id: summary for summary in result.data}
+    assert summaries.keys() == {list1_id, list2_id}
     
     # Verify first list summary
-    list1 = next(l for l in result.data if l.id == list1_id)
+    list1 = summaries[list1_id]
     assert isinstance(list1, ListSummary)
     assert list1.name == "רשימת קניות"
     assert list1.total_items == 1  # One unbought item
@@ -357,64 +269,60 @@ def test_list_all_user_lists(list_service, item_service):
     assert list1.is_default  # First list is default
     
     # Verify second list summary
-    list2 = next(l for l in result.data if l.id == list2_id)
+    list2 = summaries[list2_id]
     assert list2.name == "רשימת סופר"
     assert list2.total_items == 1
     assert list2.bought_items == 0
     assert not list2.is_default
 
 
-def test_list_all_user_lists_with_deleted(list_service):
-    """Test listing all user lists including deleted ones."""
-    # Create two lists
-    list1_result = list_service.create_list("רשימת קניות")
-    assert list1_result.success
-    
-    list2_result = list_service.create_list("רשימת סופר")
-    assert list2_result.success
-    list2_id = list2_result.data.id
-    
-    # Delete second list
-    delete_result = list_service.delete_list(list2_id)
-    assert delete_result.success
-    
-    # List active lists only
-    result = list_service.list_all_user_lists()
-    assert result.success
-    assert len(result.data) == 1
-    
-    # List all lists including deleted
-    result = list_service.list_all_user_lists(include_deleted=True)
+@pytest.fixture
+def two_lists_one_deleted(list_service, two_lists):
+    """The two_lists lists with the second one soft-deleted."""
+    _unwrap(list_service.delete_list(two_lists[1].id))
+    return two_lists
+
+
+@pytest.mark.parametrize("method,include_deleted,expected_count", [
+    pytest.param("get_lists", False, 1, id="get_lists-active"),
+    pytest.param("get_lists", True, 2, id="get_lists-all"),
+    pytest.param("list_all_user_lists", False, 1, id="summaries-active"),
+    pytest.param("list_all_user_lists", True, 2, id="summaries-all"),
+])
+def test_list_visibility(
+    list_service, two_lists_one_deleted, method, include_deleted, expected_count
+):
+    """Test that deleted lists are only listed when asked for."""
+    active_list, _ = two_lists_one_deleted
+    
+    result = getattr(list_service, method)(include_deleted=include_deleted)
     assert result.success
-    assert len(result.data) == 2
+    assert len(result.data) == expected_count
+    assert active_list.id in {list_.id for list_ in result.data}
 
 
 def test_list_all_user_lists_empty(list_service):
     """Test listing lists when user has none."""
     result = list_service.list_all_user_lists()
     assert not result.success
-    assert "לא נמצאו רשימות" in result.error
-    assert "צור רשימה חדשה" in result.suggestions
+    assert ERR_NO_LISTS in result.error
+    assert SUGGEST_CREATE_LIST in result.suggestions
 
 
-def test_is_list_soft_deleted(list_service):
+def test_is_list_soft_deleted(session, list_service, grocery_list):
     """Test checking if a list is soft-deleted."""
-    # Create list
-    list_result = list_service.create_list("רשימת קניות")
-    assert list_result.success
-    list_id = list_result.data.id
-    
     # Check active list
-    result = list_service.is_list_soft_deleted(list_id)
+    result = list_service.is_list_soft_deleted(grocery_list.id)
     assert result.success
     assert not result.data
     
-    # Delete list
-    delete_result = list_service.delete_list(list_id)
-    assert delete_result.success
+    # Soft-delete the row directly; delete_list has its own test
+    grocery_list.is_deleted = True
+    grocery_list.deleted_at = datetime.now(UTC)
+    session.commit()
     
     # Check deleted list
-    result = list_service.is_list_soft_deleted(list_id)
+    result = list_service.is_list_soft_deleted(grocery_list.id)
     assert result.success
     assert result.data
 
@@ -424,4 +332,58 @@ def test_is_list_soft_deleted_errors(list_service):
     # Non-existent list
     result = list_service.is_list_soft_deleted(999)
     assert not result.success
-    assert "רשימה לא נמצאה" in result.error 
\ No newline at end of file
+    assert ERR_LIST_NOT_FOUND in result.error
+
+
+def test_get_fingerprint(list_service, list_id, item_service):
+    """Test that the list fingerprint tracks item changes."""
+    # Empty list
+    result = list_service.get_fingerprint(list_id)
+    assert result.success
+    assert result.data[0] == 0
+    assert result.data[1] is None
+    empty_fingerprint = result.data
+    
+    # Add item
+    item = _unwrap(item_service.add_item(list_id, "חלב"))
+    
+    result = list_service.get_fingerprint(list_id)
+    assert result.success
+    assert result.data[0] == 1
+    assert result.data[1] is not None
+    assert result.data != empty_fingerprint
+    added_fingerprint = result.data
+    
+    # Update item
+    _unwrap(item_service.update_item(item.id, quantity=2))
+    
+    result = list_service.get_fingerprint(list_id)
+    assert result.success
+    assert result.data[0] == 1
+    assert result.data != added_fingerprint
+
+
+@pytest.mark.parametrize("change", [
+    pytest.param(lambda lists, items, list_id, item_id: items.add_item(list_id, "לחם"), id="add"),
+    pytest.param(lambda lists, items, list_id, item_id: lists.rename_list(list_id, "רשימת סופר"), id="rename"),
+    pytest.param(lambda lists, items, list_id, item_id: items.mark_bought(item_id), id="check"),
+])
+def test_get_fingerprint_changes(production_session, user_id, change):
+    """Test that every kind of list change yields a new fingerprint."""
+    list_service = ListService(production_session, user_id)
+    item_service = ItemService(production_session, user_id)
+    list_id = _unwrap(list_service.create_list("רשימת קניות")).id
+    item_id = _unwrap(item_service.add_item(list_id, "חלב")).id
+    before = _unwrap(list_service.get_fingerprint(list_id))
+    
+    _unwrap(change(list_service, item_service, list_id, item_id))
+    
+    assert _unwrap(list_service.get_fingerprint(list_id)) != before
+
+
+def test_get_fingerprint_errors(list_service):
+    """Test error cases for get_fingerprint."""
+    # Non-existent list
+    result = list_service.get_fingerprint(999)
+    assert not result.success
+    assert ERR_LIST_NOT_FOUND in result.error
@@ -0,0 +1,88 @@
+"""Tests for the list display's cached list fetch."""
+import pytest
+
+from baskit.services.list_service import ListService
+from baskit.services.item_service import ItemService
+from baskit.web.components.list_display import _fetch_list, _get_list_contents
+
+# Fragment of the service's Hebrew error for a soft-deleted list
+ERR_LIST_DELETED = "נמחקה"
+
+
+def _unwrap(result):
+    """Return a setup step's data, failing with its error if it failed."""
+    assert result.success, result.error
+    return result.data
+
+
+@pytest.fixture(autouse=True)
+def clear_list_cache():
+    """Start and end every test with an empty list cache."""
+    _fetch_list.clear()
+    yield
+    _fetch_list.clear()
+
+
+@pytest.fixture
+def list_service(production_session, user_id, monkeypatch):
+    """List service on an expiring session, counting full list fetches."""
+    service = ListService(production_session, user_id)
+    service.show_list_calls = 0
+    show_list = service.show_list
+
+    def _counting_show_list(*args, **kwargs):
+        service.show_list_calls += 1
+        return show_list(*args, **kwargs)
+
+    monkeypatch.setattr(service, "show_list", _counting_show_list)
+    return service
+
+
+@pytest.fixture
+def item_service(production_session, user_id):
+    """Item service sharing the list service's expiring session."""
+    return ItemService(production_session, user_id)
+
+
+@pytest.fixture
+def list_id(list_service, item_service) -> int:
+    """Create a list holding one item."""
+    list_id = _unwrap(list_service.create_list("רשימת קניות")).id
+    _unwrap(item_service.add_item(list_id, "חלב", 2, "ליטר"))
+    return list_id
+
+
+def test_get_list_contents_cache_hit(list_service, list_id):
+    """Test that an unchanged list is served from the cache, fully loaded."""
+    first = _unwrap(_get_list_contents(list_service, list_id))
+    second = _unwrap(_get_list_contents(list_service, list_id))
+
+    assert list_service.show_list_calls == 1
+    assert second == first
+    assert second.name == "רשימת קניות"
+    assert [(i.name, i.quantity, i.unit, i.is_bought) for i in second.items] == [
+        ("חלב", 2, "ליטר", False)
+    ]
+
+
+def test_get_list_contents_refetches_changed_list(list_service, item_service, list_id):
+    """Test that a changed list misses the cache."""
+    item = _unwrap(_get_list_contents(list_service, list_id)).items[0]
+    _unwrap(item_service.mark_bought(item.id))
+
+    contents = _unwrap(_get_list_contents(list_service, list_id))
+
+    assert list_service.show_list_calls == 2
+    assert contents.items[0].is_bought
+
+
+def test_get_list_contents_failure_not_cached(list_service, list_id):
+    """Test that a failed fetch is retried rather than served from the cache."""
+    _unwrap(list_service.delete_list(list_id))
+
+    for _ in range(2):
+        result = _get_list_contents(list_service, list_id)
+        assert not result.success
+        assert ERR_LIST_DELETED in result.error
+
+    assert list_service.show_list_calls == 2